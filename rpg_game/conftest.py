@@ -0,0 +1,103 @@
+"""Shared pytest fixtures for the RPG test suite.
+
+Expensive setup (SDL bring-up, game construction) is session-scoped so
+every test shares one instance instead of re-initializing per test.
+"""
+
+import copy
+import functools
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+# Must be set before pygame is first imported so SDL never probes for a
+# real video driver on headless machines
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+from monsters import MonsterFactory
+from player import Player
+from save_load import SaveLoadManager
+
+# test_animations drives an interactive window loop; it is run manually,
+# not collected by pytest
+collect_ignore = ["test_animations.py"]
+
+
+@pytest.fixture(scope="session")
+def pygame_ctx():
+    """Initialize pygame once, headless, for the whole session."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def _player_template():
+    """One canonical player built per session; tests copy it."""
+    return Player("Template")
+
+
+@pytest.fixture
+def player(_player_template):
+    """A fresh default player for tests that mutate player state.
+
+    Deep-copying the session template skips re-running __init__
+    (equipment, inventory, and visited-location seeding) per test.
+    """
+    p = copy.deepcopy(_player_template)
+    p.name = "TestHero"
+    return p
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_monster(kind, level=None):
+    if level is not None:
+        return MonsterFactory.create_monster(kind, level)
+    return MonsterFactory.create_monster(kind)
+
+
+@pytest.fixture(scope="session")
+def monster_factory_cached():
+    """Memoized monster factory for read-only assertions.
+
+    Repeated calls with the same arguments return the same instance, so
+    tests that mutate monster state (take_damage etc.) must use
+    MonsterFactory directly or deepcopy the cached monster.
+    """
+    return _cached_monster
+
+
+@pytest.fixture(scope="session")
+def save_root(tmp_path_factory):
+    """Parent directory for save/load tests, made once per session.
+
+    Prefers memory-backed /dev/shm where it exists so the save/load
+    roundtrips never touch real disk; otherwise falls back to pytest's
+    temp root, which it cleans up itself.
+    """
+    if os.path.isdir('/dev/shm'):
+        root = tempfile.mkdtemp(prefix='rpg-saves-', dir='/dev/shm')
+        yield Path(root)
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("saves")
+
+
+@pytest.fixture
+def save_manager(save_root, request):
+    """A SaveLoadManager rooted in a per-test subdirectory of save_root."""
+    manager = SaveLoadManager(str(save_root / request.node.name))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture(scope="session")
+def game(pygame_ctx):
+    """One game instance shared by every test that inspects it."""
+    from graphical_game import GraphicalRPGGame
+    return GraphicalRPGGame()
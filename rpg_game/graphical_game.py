@@ -12,7 +12,7 @@ from game_world import GameWorld, Location
 from save_load import SaveLoadManager
 from graphics_engine import (
     UI, Colors, PlayerSprite, MonsterSprite, LocationSprite, WallSprite,
-    GameSprite, create_simple_sprites, test_graphics_engine
+    GameSprite, SpriteBatch, create_simple_sprites, test_graphics_engine
 )
 
 
@@ -41,6 +41,7 @@ class GraphicalRPGGame:
         self.running = True
         self.game_state = "character_creation"  # character_creation, menu, playing, combat, paused, game_over
         self.last_update = pygame.time.get_ticks()
+        self._last_rendered_state = None  # Tracks state changes for dirty-rect updates
         
         # Character creation
         self.character_name = ""
@@ -54,7 +55,7 @@ class GraphicalRPGGame:
         
         # Graphics and sprites
         self.all_sprites = pygame.sprite.Group()
-        self.location_sprites = pygame.sprite.Group()
+        self.location_sprites = SpriteBatch()
         self.monster_sprites = pygame.sprite.Group()
         self.item_sprites = pygame.sprite.Group()
         self.wall_sprites = pygame.sprite.Group()
@@ -241,6 +242,7 @@ class GraphicalRPGGame:
             return
             
         # Create sprites for discovered locations
+        self.location_sprites.clear()
         grid_size = 64
         
         for coords, location in self.world.locations.items():
@@ -263,7 +265,6 @@ class GraphicalRPGGame:
             location_sprite.world_y = y
             
             self.location_sprites.add(location_sprite)
-            self.all_sprites.add(location_sprite)
     
     def _try_load_saved_game(self):
         if self.player and self.save_manager.load_player_data(self.player):
@@ -642,10 +643,18 @@ class GraphicalRPGGame:
             self._render_game_over()
         
         # Always render notifications
-        self.ui.draw_notifications(self.screen)
-        
-        # Update display
-        pygame.display.flip()
+        notif_rect = self.ui.draw_notifications(self.screen)
+        
+        # Static screens repaint identically every frame, so after the
+        # first frame only the notification area can differ — push just
+        # that rect instead of copying the whole framebuffer
+        static_screen = self.game_state in ("menu", "paused", "game_over")
+        if static_screen and self.game_state == self._last_rendered_state:
+            if notif_rect is not None:
+                pygame.display.update(notif_rect)
+        else:
+            pygame.display.flip()
+        self._last_rendered_state = self.game_state
     
     def _render_character_creation(self):
         title_font = pygame.freetype.Font(None, 48)
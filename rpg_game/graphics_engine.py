@@ -17,6 +17,8 @@ import math
 import os
 from enum import Enum
 
+from monsters import combat_log
+
 
 class Colors:
     """Centralized color definitions for consistent theming throughout the game."""
@@ -58,6 +60,320 @@ class Colors:
     XP_PURPLE = (138, 43, 226)
 
 
+# Shared frame sets keyed by the walking flag. Every PlayerSprite (and
+# every walk/idle toggle) reuses the same surfaces; _update_sprite_image
+# copies the frame it shows, so sharing the sources is safe.
+_player_frames_cache: dict = {}
+
+
+def build_player_frames(walking: bool) -> dict:
+    """Rasterize the warrior animation frames for every facing direction.
+
+    Kept as a module-level function so sprite synthesis happens in one
+    place and is shared (flyweight) across sprite instances: the frames
+    are drawn once per walking state for the whole process.
+
+    Args:
+        walking (bool): Whether to draw the walking (bobbing) variant
+
+    Returns:
+        dict: Mapping of direction name to a list of 4 frame Surfaces
+    """
+    cached = _player_frames_cache.get(walking)
+    if cached is not None:
+        return cached
+    animation_frames = {}
+    for direction in ["up", "down", "left", "right"]:
+        animation_frames[direction] = []
+        for frame in range(4):  # 4 animation frames
+            frame_surface = pygame.Surface((32, 32))
+            frame_surface.set_colorkey(Colors.BLACK)  # Transparent background
+
+            # Create detailed warrior character
+            center_x, center_y = 16, 16
+
+            # Base body position with walking animation
+            body_offset = 0
+            if walking:
+                body_offset = (frame % 2) * 1 - 0.5  # Subtle bobbing
+
+            # Draw character based on direction
+            if direction == "down":  # Facing player
+                # Head (flesh color)
+                pygame.draw.circle(frame_surface, (255, 220, 177), (center_x, 8), 6)
+                # Hair (brown)
+                pygame.draw.arc(frame_surface, (139, 69, 19), (10, 2, 12, 8), 0, 3.14159, 2)
+                # Eyes
+                pygame.draw.circle(frame_surface, Colors.BLACK, (13, 7), 1)
+                pygame.draw.circle(frame_surface, Colors.BLACK, (19, 7), 1)
+
+                # Body (blue tunic)
+                body_y = 15 + int(body_offset)
+                pygame.draw.rect(frame_surface, (0, 100, 200), (12, body_y, 8, 12))
+                # Armor chest plate (silver)
+                pygame.draw.rect(frame_surface, Colors.SILVER, (13, body_y, 6, 8))
+
+                # Arms
+                arm_y = 17 + int(body_offset)
+                pygame.draw.rect(frame_surface, (255, 220, 177), (9, arm_y, 3, 8))   # Left arm
+                pygame.draw.rect(frame_surface, (255, 220, 177), (20, arm_y, 3, 8))  # Right arm
+
+                # Legs with walking animation
+                leg_y = 27 + int(body_offset)
+                if walking:
+                    leg_offset = (frame % 2) * 2 - 1
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (13, leg_y + leg_offset, 2, 5))  # Left leg
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y - leg_offset, 2, 5))  # Right leg
+                else:
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (13, leg_y, 2, 5))  # Left leg
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y, 2, 5))  # Right leg
+
+                # Sword (held in right hand)
+                pygame.draw.rect(frame_surface, Colors.GRAY, (21, arm_y - 2, 2, 10))
+                pygame.draw.rect(frame_surface, Colors.GOLD, (20, arm_y - 3, 4, 2))  # Hilt
+
+            elif direction == "up":  # Back view
+                # Head (flesh color)
+                pygame.draw.circle(frame_surface, (255, 220, 177), (center_x, 8), 6)
+                # Hair (brown) - back of head
+                pygame.draw.circle(frame_surface, (139, 69, 19), (center_x, 7), 7, 2)
+
+                # Body (blue tunic)
+                body_y = 15 + int(body_offset)
+                pygame.draw.rect(frame_surface, (0, 100, 200), (12, body_y, 8, 12))
+                # Back armor
+                pygame.draw.rect(frame_surface, Colors.DARK_GRAY, (13, body_y, 6, 8))
+
+                # Arms (showing back)
+                arm_y = 17 + int(body_offset)
+                pygame.draw.rect(frame_surface, (255, 220, 177), (9, arm_y, 3, 8))   # Left arm
+                pygame.draw.rect(frame_surface, (255, 220, 177), (20, arm_y, 3, 8))  # Right arm
+
+                # Legs
+                leg_y = 27 + int(body_offset)
+                if walking:
+                    leg_offset = (frame % 2) * 2 - 1
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (13, leg_y - leg_offset, 2, 5))
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y + leg_offset, 2, 5))
+                else:
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (13, leg_y, 2, 5))
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y, 2, 5))
+
+                # Shield on back
+                pygame.draw.ellipse(frame_surface, Colors.BROWN, (7, body_y + 2, 4, 6))
+
+            elif direction == "left":  # Side view facing left
+                # Head profile
+                pygame.draw.circle(frame_surface, (255, 220, 177), (center_x, 8), 6)
+                # Hair
+                pygame.draw.arc(frame_surface, (139, 69, 19), (10, 2, 12, 8), 0, 3.14159, 2)
+                # Eye
+                pygame.draw.circle(frame_surface, Colors.BLACK, (13, 7), 1)
+
+                # Body side view
+                body_y = 15 + int(body_offset)
+                pygame.draw.rect(frame_surface, (0, 100, 200), (12, body_y, 8, 12))
+                pygame.draw.rect(frame_surface, Colors.SILVER, (11, body_y, 4, 8))  # Side armor
+
+                # Arms (left side showing)
+                arm_y = 17 + int(body_offset)
+                pygame.draw.rect(frame_surface, (255, 220, 177), (8, arm_y, 6, 4))  # Visible arm
+
+                # Legs side view with walking
+                leg_y = 27 + int(body_offset)
+                if walking:
+                    leg_offset = (frame % 2) * 3 - 1
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (12 + leg_offset, leg_y, 3, 5))  # Front leg
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (15 - leg_offset, leg_y, 3, 5))  # Back leg
+                else:
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (12, leg_y, 3, 5))
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (15, leg_y, 3, 5))
+
+                # Sword pointing forward
+                pygame.draw.rect(frame_surface, Colors.GRAY, (4, arm_y, 8, 2))
+                pygame.draw.rect(frame_surface, Colors.GOLD, (3, arm_y - 1, 2, 4))  # Hilt
+
+            else:  # right
+                # Head profile (facing right)
+                pygame.draw.circle(frame_surface, (255, 220, 177), (center_x, 8), 6)
+                # Hair
+                pygame.draw.arc(frame_surface, (139, 69, 19), (10, 2, 12, 8), 0, 3.14159, 2)
+                # Eye
+                pygame.draw.circle(frame_surface, Colors.BLACK, (19, 7), 1)
+
+                # Body side view
+                body_y = 15 + int(body_offset)
+                pygame.draw.rect(frame_surface, (0, 100, 200), (12, body_y, 8, 12))
+                pygame.draw.rect(frame_surface, Colors.SILVER, (17, body_y, 4, 8))  # Side armor
+
+                # Arms (right side showing)
+                arm_y = 17 + int(body_offset)
+                pygame.draw.rect(frame_surface, (255, 220, 177), (18, arm_y, 6, 4))  # Visible arm
+
+                # Legs side view with walking
+                leg_y = 27 + int(body_offset)
+                if walking:
+                    leg_offset = (frame % 2) * 3 - 1
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (14 - leg_offset, leg_y, 3, 5))  # Front leg
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (17 + leg_offset, leg_y, 3, 5))  # Back leg
+                else:
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (14, leg_y, 3, 5))
+                    pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y, 3, 5))
+
+                # Sword pointing forward
+                pygame.draw.rect(frame_surface, Colors.GRAY, (20, arm_y, 8, 2))
+                pygame.draw.rect(frame_surface, Colors.GOLD, (27, arm_y - 1, 2, 4))  # Hilt
+
+            animation_frames[direction].append(frame_surface)
+
+    _player_frames_cache[walking] = animation_frames
+    return animation_frames
+
+
+# Color tables for the 8-bit indexed monster surfaces (index 0 is the
+# black colorkey; the draw calls below map RGB colors onto these entries)
+_MONSTER_PALETTES = {
+    "goblin": ((0, 150, 0), (0, 100, 0), Colors.RED),
+    "orc": ((150, 0, 0), (120, 0, 0), Colors.WHITE, Colors.YELLOW, Colors.RED),
+    "dragon": ((128, 0, 128), (100, 0, 100), (80, 0, 80), Colors.ORANGE, Colors.RED),
+    "slime": ((0, 255, 255), (150, 255, 255), (200, 255, 255)),
+    "default": ((64, 0, 64), Colors.YELLOW),
+}
+
+
+def _indexed_surface(width: int, height: int, palette, colorkey=Colors.BLACK) -> pygame.Surface:
+    """Create an 8-bit indexed-palette Surface for low-color sprite art.
+
+    Storing wall/monster art at 8 bits per pixel quarters the source bytes
+    each blit has to fetch compared to a 32-bit surface.
+
+    Args:
+        width, height (int): Surface dimensions
+        palette: Iterable of RGB colors used by the artwork
+        colorkey: Transparent color placed at palette index 0, or None
+
+    Returns:
+        pygame.Surface: 8-bit surface with the palette installed
+    """
+    surface = pygame.Surface((width, height), 0, 8)
+    colors = [Colors.BLACK] + list(palette)
+    # Pad with black so unused entries never win a nearest-color match
+    surface.set_palette(colors + [Colors.BLACK] * (256 - len(colors)))
+    if colorkey is not None:
+        surface.set_colorkey(colorkey)
+    return surface
+
+
+def _convert_for_display(surface: pygame.Surface, colorkey=Colors.BLACK) -> pygame.Surface:
+    """Convert a sprite surface to the display format once, at build time.
+
+    Blitting an 8-bit surface onto the 32-bit screen would otherwise pay a
+    pixel-format conversion on every blit. No-op before the display exists
+    (e.g. during tests that build sprites headless).
+    """
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+        if colorkey is not None:
+            surface.set_colorkey(colorkey)
+    return surface
+
+
+def build_monster_surface(monster_type: str) -> pygame.Surface:
+    """Rasterize the 32x32 artwork for a monster type.
+
+    Args:
+        monster_type (str): Lowercase monster type name
+
+    Returns:
+        pygame.Surface: Freshly drawn monster surface with colorkey transparency
+    """
+    palette = _MONSTER_PALETTES.get(monster_type, _MONSTER_PALETTES["default"])
+    image = _indexed_surface(32, 32, palette)
+
+    center_x, center_y = 16, 16
+
+    if monster_type == "goblin":
+        # Green goblin - small and wiry
+        # Head
+        pygame.draw.circle(image, (0, 150, 0), (center_x, 10), 8)
+        # Large pointed ears
+        pygame.draw.polygon(image, (0, 150, 0), [(8, 8), (6, 4), (10, 6)])
+        pygame.draw.polygon(image, (0, 150, 0), [(22, 8), (26, 4), (24, 6)])
+        # Evil red eyes
+        pygame.draw.circle(image, Colors.RED, (12, 9), 2)
+        pygame.draw.circle(image, Colors.RED, (20, 9), 2)
+        # Body (dark green)
+        pygame.draw.rect(image, (0, 100, 0), (12, 18, 8, 10))
+        # Arms with claws
+        pygame.draw.rect(image, (0, 150, 0), (8, 20, 4, 6))
+        pygame.draw.rect(image, (0, 150, 0), (20, 20, 4, 6))
+        # Legs
+        pygame.draw.rect(image, (0, 100, 0), (13, 28, 2, 4))
+        pygame.draw.rect(image, (0, 100, 0), (17, 28, 2, 4))
+
+    elif monster_type == "orc":
+        # Red orc - large and muscular
+        # Large head
+        pygame.draw.circle(image, (150, 0, 0), (center_x, 12), 10)
+        # Tusks
+        pygame.draw.polygon(image, Colors.WHITE, [(12, 15), (10, 18), (14, 17)])
+        pygame.draw.polygon(image, Colors.WHITE, [(20, 15), (18, 17), (22, 18)])
+        # Angry yellow eyes
+        pygame.draw.circle(image, Colors.YELLOW, (11, 10), 2)
+        pygame.draw.circle(image, Colors.YELLOW, (21, 10), 2)
+        pygame.draw.circle(image, Colors.RED, (11, 10), 1)
+        pygame.draw.circle(image, Colors.RED, (21, 10), 1)
+        # Muscular body
+        pygame.draw.rect(image, (120, 0, 0), (10, 22, 12, 8))
+        # Large arms
+        pygame.draw.rect(image, (150, 0, 0), (6, 24, 4, 8))
+        pygame.draw.rect(image, (150, 0, 0), (22, 24, 4, 8))
+        # Thick legs
+        pygame.draw.rect(image, (120, 0, 0), (12, 30, 3, 4))
+        pygame.draw.rect(image, (120, 0, 0), (17, 30, 3, 4))
+
+    elif monster_type == "dragon":
+        # Purple dragon - serpentine
+        # Dragon head (elongated)
+        pygame.draw.ellipse(image, (128, 0, 128), (8, 6, 16, 12))
+        # Dragon snout
+        pygame.draw.ellipse(image, (128, 0, 128), (20, 10, 8, 6))
+        # Fierce orange eyes
+        pygame.draw.circle(image, Colors.ORANGE, (12, 11), 2)
+        pygame.draw.circle(image, Colors.ORANGE, (20, 11), 2)
+        pygame.draw.circle(image, Colors.RED, (12, 11), 1)
+        pygame.draw.circle(image, Colors.RED, (20, 11), 1)
+        # Body (coiled)
+        pygame.draw.ellipse(image, (100, 0, 100), (6, 18, 20, 8))
+        # Wings
+        pygame.draw.polygon(image, (80, 0, 80), [(4, 20), (2, 16), (8, 18)])
+        pygame.draw.polygon(image, (80, 0, 80), [(28, 20), (30, 16), (24, 18)])
+        # Tail
+        pygame.draw.ellipse(image, (128, 0, 128), (12, 26, 8, 6))
+
+    elif monster_type == "slime":
+        # Cyan slime - blob-like
+        # Main blob body
+        pygame.draw.ellipse(image, (0, 255, 255), (6, 12, 20, 16))
+        # Glossy highlights
+        pygame.draw.ellipse(image, (150, 255, 255), (8, 14, 8, 6))
+        # Simple dot eyes
+        pygame.draw.circle(image, Colors.BLACK, (12, 18), 2)
+        pygame.draw.circle(image, Colors.BLACK, (20, 18), 2)
+        # Small bubbles around it
+        pygame.draw.circle(image, (200, 255, 255), (26, 16), 1)
+        pygame.draw.circle(image, (200, 255, 255), (6, 20), 1)
+        pygame.draw.circle(image, (200, 255, 255), (24, 26), 1)
+
+    else:
+        # Default monster - mysterious shadow
+        pygame.draw.ellipse(image, (64, 0, 64), (8, 8, 16, 20))
+        pygame.draw.circle(image, Colors.YELLOW, (12, 14), 2)
+        pygame.draw.circle(image, Colors.YELLOW, (20, 14), 2)
+
+    return _convert_for_display(image)
+
+
 class GameSprite(pygame.sprite.Sprite):
     """Base sprite class for all game objects.
     
@@ -140,154 +456,15 @@ class PlayerSprite(GameSprite):
         self.direction = "down"
         self.walking = False
         self.animation_frames = {}
+        self._idle_image_set = False
         self._create_animation_frames()
         self._update_sprite_image()
    
     def _create_animation_frames(self):
-        # Create frames for each direction and animation state
-        for direction in ["up", "down", "left", "right"]:
-            self.animation_frames[direction] = []
-            for frame in range(4):  # 4 animation frames
-                frame_surface = pygame.Surface((32, 32))
-                frame_surface.set_colorkey(Colors.BLACK)  # Transparent background
-                
-                # Create detailed warrior character
-                center_x, center_y = 16, 16
-                
-                # Base body position with walking animation
-                body_offset = 0
-                if self.walking:
-                    body_offset = (frame % 2) * 1 - 0.5  # Subtle bobbing
-                
-                # Draw character based on direction
-                if direction == "down":  # Facing player
-                    # Head (flesh color)
-                    pygame.draw.circle(frame_surface, (255, 220, 177), (center_x, 8), 6)
-                    # Hair (brown)
-                    pygame.draw.arc(frame_surface, (139, 69, 19), (10, 2, 12, 8), 0, 3.14159, 2)
-                    # Eyes
-                    pygame.draw.circle(frame_surface, Colors.BLACK, (13, 7), 1)
-                    pygame.draw.circle(frame_surface, Colors.BLACK, (19, 7), 1)
-                    
-                    # Body (blue tunic)
-                    body_y = 15 + int(body_offset)
-                    pygame.draw.rect(frame_surface, (0, 100, 200), (12, body_y, 8, 12))
-                    # Armor chest plate (silver)
-                    pygame.draw.rect(frame_surface, Colors.SILVER, (13, body_y, 6, 8))
-                    
-                    # Arms
-                    arm_y = 17 + int(body_offset)
-                    pygame.draw.rect(frame_surface, (255, 220, 177), (9, arm_y, 3, 8))   # Left arm
-                    pygame.draw.rect(frame_surface, (255, 220, 177), (20, arm_y, 3, 8))  # Right arm
-                    
-                    # Legs with walking animation
-                    leg_y = 27 + int(body_offset)
-                    if self.walking:
-                        leg_offset = (frame % 2) * 2 - 1
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (13, leg_y + leg_offset, 2, 5))  # Left leg
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y - leg_offset, 2, 5))  # Right leg
-                    else:
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (13, leg_y, 2, 5))  # Left leg
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y, 2, 5))  # Right leg
-                    
-                    # Sword (held in right hand)
-                    pygame.draw.rect(frame_surface, Colors.GRAY, (21, arm_y - 2, 2, 10))
-                    pygame.draw.rect(frame_surface, Colors.GOLD, (20, arm_y - 3, 4, 2))  # Hilt
-                    
-                elif direction == "up":  # Back view
-                    # Head (flesh color)
-                    pygame.draw.circle(frame_surface, (255, 220, 177), (center_x, 8), 6)
-                    # Hair (brown) - back of head
-                    pygame.draw.circle(frame_surface, (139, 69, 19), (center_x, 7), 7, 2)
-                    
-                    # Body (blue tunic)
-                    body_y = 15 + int(body_offset)
-                    pygame.draw.rect(frame_surface, (0, 100, 200), (12, body_y, 8, 12))
-                    # Back armor
-                    pygame.draw.rect(frame_surface, Colors.DARK_GRAY, (13, body_y, 6, 8))
-                    
-                    # Arms (showing back)
-                    arm_y = 17 + int(body_offset)
-                    pygame.draw.rect(frame_surface, (255, 220, 177), (9, arm_y, 3, 8))   # Left arm
-                    pygame.draw.rect(frame_surface, (255, 220, 177), (20, arm_y, 3, 8))  # Right arm
-                    
-                    # Legs
-                    leg_y = 27 + int(body_offset)
-                    if self.walking:
-                        leg_offset = (frame % 2) * 2 - 1
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (13, leg_y - leg_offset, 2, 5))
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y + leg_offset, 2, 5))
-                    else:
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (13, leg_y, 2, 5))
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y, 2, 5))
-                    
-                    # Shield on back
-                    pygame.draw.ellipse(frame_surface, Colors.BROWN, (7, body_y + 2, 4, 6))
-                    
-                elif direction == "left":  # Side view facing left
-                    # Head profile
-                    pygame.draw.circle(frame_surface, (255, 220, 177), (center_x, 8), 6)
-                    # Hair
-                    pygame.draw.arc(frame_surface, (139, 69, 19), (10, 2, 12, 8), 0, 3.14159, 2)
-                    # Eye
-                    pygame.draw.circle(frame_surface, Colors.BLACK, (13, 7), 1)
-                    
-                    # Body side view
-                    body_y = 15 + int(body_offset)
-                    pygame.draw.rect(frame_surface, (0, 100, 200), (12, body_y, 8, 12))
-                    pygame.draw.rect(frame_surface, Colors.SILVER, (11, body_y, 4, 8))  # Side armor
-                    
-                    # Arms (left side showing)
-                    arm_y = 17 + int(body_offset)
-                    pygame.draw.rect(frame_surface, (255, 220, 177), (8, arm_y, 6, 4))  # Visible arm
-                    
-                    # Legs side view with walking
-                    leg_y = 27 + int(body_offset)
-                    if self.walking:
-                        leg_offset = (frame % 2) * 3 - 1
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (12 + leg_offset, leg_y, 3, 5))  # Front leg
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (15 - leg_offset, leg_y, 3, 5))  # Back leg
-                    else:
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (12, leg_y, 3, 5))
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (15, leg_y, 3, 5))
-                    
-                    # Sword pointing forward
-                    pygame.draw.rect(frame_surface, Colors.GRAY, (4, arm_y, 8, 2))
-                    pygame.draw.rect(frame_surface, Colors.GOLD, (3, arm_y - 1, 2, 4))  # Hilt
-                    
-                else:  # right
-                    # Head profile (facing right)
-                    pygame.draw.circle(frame_surface, (255, 220, 177), (center_x, 8), 6)
-                    # Hair
-                    pygame.draw.arc(frame_surface, (139, 69, 19), (10, 2, 12, 8), 0, 3.14159, 2)
-                    # Eye
-                    pygame.draw.circle(frame_surface, Colors.BLACK, (19, 7), 1)
-                    
-                    # Body side view
-                    body_y = 15 + int(body_offset)
-                    pygame.draw.rect(frame_surface, (0, 100, 200), (12, body_y, 8, 12))
-                    pygame.draw.rect(frame_surface, Colors.SILVER, (17, body_y, 4, 8))  # Side armor
-                    
-                    # Arms (right side showing)
-                    arm_y = 17 + int(body_offset)
-                    pygame.draw.rect(frame_surface, (255, 220, 177), (18, arm_y, 6, 4))  # Visible arm
-                    
-                    # Legs side view with walking
-                    leg_y = 27 + int(body_offset)
-                    if self.walking:
-                        leg_offset = (frame % 2) * 3 - 1
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (14 - leg_offset, leg_y, 3, 5))  # Front leg
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (17 + leg_offset, leg_y, 3, 5))  # Back leg
-                    else:
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (14, leg_y, 3, 5))
-                        pygame.draw.rect(frame_surface, (139, 69, 19), (17, leg_y, 3, 5))
-                    
-                    # Sword pointing forward
-                    pygame.draw.rect(frame_surface, Colors.GRAY, (20, arm_y, 8, 2))
-                    pygame.draw.rect(frame_surface, Colors.GOLD, (27, arm_y - 1, 2, 4))  # Hilt
-                
-                self.animation_frames[direction].append(frame_surface)
-    
+        # Frames for each direction and animation state come from the
+        # module-level builder so synthesis lives in one place
+        self.animation_frames = build_player_frames(self.walking)
+
     def _update_sprite_image(self):
         frame_index = int(self.animation_frame) % len(self.animation_frames[self.direction])
         self.image = self.animation_frames[self.direction][frame_index].copy()
@@ -313,24 +490,34 @@ class PlayerSprite(GameSprite):
         sprite_direction = direction_mapping.get(direction.lower(), "down")
         self.direction = sprite_direction
         self.walking = True
+        self._idle_image_set = False
         self._create_animation_frames()  # Recreate frames with walking animation
-    
+
     def stop_walking(self):
+        if not self.walking:
+            return  # Already idle, frames are current
         self.walking = False
         self._create_animation_frames()  # Recreate frames without walking animation
-    
+
     def update(self):
+        # Idle fast path: no movement or walking animation means the frame
+        # image cannot change, so skip the per-frame work entirely
+        if self._idle_image_set and not self.is_moving and not self.walking:
+            return
+
         super().update()
         self._update_sprite_image()
-        
+
         # Stop walking animation when not moving
         if not self.is_moving:
             self.stop_walking()
+            self._idle_image_set = True
     
     def smooth_move_to(self, target_x: int, target_y: int, direction: str):
         self.target_x = target_x
         self.target_y = target_y
         self.is_moving = True
+        self._idle_image_set = False
         self.set_direction(direction)
         self.move_speed = 4.0  # Smooth movement speed
 
@@ -342,7 +529,9 @@ class WallSprite(GameSprite):
         self._create_wall_sprite()
     
     def _create_wall_sprite(self):
-        self.image = pygame.Surface((32, 32))
+        # Walls only use two colors, so an 8-bit indexed surface is enough
+        self.image = _indexed_surface(32, 32, (Colors.WALL, Colors.GRAY),
+                                      colorkey=None)
         
         # Draw solid wall
         self.image.fill(Colors.WALL)
@@ -350,109 +539,39 @@ class WallSprite(GameSprite):
         for i in range(0, 32, 8):
             pygame.draw.line(self.image, Colors.GRAY, (i, 0), (i, 32), 1)
             pygame.draw.line(self.image, Colors.GRAY, (0, i), (32, i), 1)
+        
+        self.image = _convert_for_display(self.image, colorkey=None)
 
 class MonsterSprite(GameSprite):
-    
+
+    # Shared artwork per monster type: the art is static, so a hundred
+    # goblins can safely reference the one surface drawn for the first
+    _surface_cache: dict = {}
+
     def __init__(self, x: int, y: int, monster_type: str):
         super().__init__(x, y, 32, 32, Colors.RED)
         self.monster_type = monster_type.lower()
         self.animation_frame = 0
         self._create_monster_sprite()
-    
+
     def _create_monster_sprite(self):
-        self.image = pygame.Surface((32, 32))
-        self.image.set_colorkey(Colors.BLACK)  # Transparent background
-        
-        center_x, center_y = 16, 16
-        
-        if self.monster_type == "goblin":
-            # Green goblin - small and wiry
-            # Head
-            pygame.draw.circle(self.image, (0, 150, 0), (center_x, 10), 8)
-            # Large pointed ears
-            pygame.draw.polygon(self.image, (0, 150, 0), [(8, 8), (6, 4), (10, 6)])
-            pygame.draw.polygon(self.image, (0, 150, 0), [(22, 8), (26, 4), (24, 6)])
-            # Evil red eyes
-            pygame.draw.circle(self.image, Colors.RED, (12, 9), 2)
-            pygame.draw.circle(self.image, Colors.RED, (20, 9), 2)
-            # Body (dark green)
-            pygame.draw.rect(self.image, (0, 100, 0), (12, 18, 8, 10))
-            # Arms with claws
-            pygame.draw.rect(self.image, (0, 150, 0), (8, 20, 4, 6))
-            pygame.draw.rect(self.image, (0, 150, 0), (20, 20, 4, 6))
-            # Legs
-            pygame.draw.rect(self.image, (0, 100, 0), (13, 28, 2, 4))
-            pygame.draw.rect(self.image, (0, 100, 0), (17, 28, 2, 4))
-            
-        elif self.monster_type == "orc":
-            # Red orc - large and muscular
-            # Large head
-            pygame.draw.circle(self.image, (150, 0, 0), (center_x, 12), 10)
-            # Tusks
-            pygame.draw.polygon(self.image, Colors.WHITE, [(12, 15), (10, 18), (14, 17)])
-            pygame.draw.polygon(self.image, Colors.WHITE, [(20, 15), (18, 17), (22, 18)])
-            # Angry yellow eyes
-            pygame.draw.circle(self.image, Colors.YELLOW, (11, 10), 2)
-            pygame.draw.circle(self.image, Colors.YELLOW, (21, 10), 2)
-            pygame.draw.circle(self.image, Colors.RED, (11, 10), 1)
-            pygame.draw.circle(self.image, Colors.RED, (21, 10), 1)
-            # Muscular body
-            pygame.draw.rect(self.image, (120, 0, 0), (10, 22, 12, 8))
-            # Large arms
-            pygame.draw.rect(self.image, (150, 0, 0), (6, 24, 4, 8))
-            pygame.draw.rect(self.image, (150, 0, 0), (22, 24, 4, 8))
-            # Thick legs
-            pygame.draw.rect(self.image, (120, 0, 0), (12, 30, 3, 4))
-            pygame.draw.rect(self.image, (120, 0, 0), (17, 30, 3, 4))
-            
-        elif self.monster_type == "dragon":
-            # Purple dragon - serpentine
-            # Dragon head (elongated)
-            pygame.draw.ellipse(self.image, (128, 0, 128), (8, 6, 16, 12))
-            # Dragon snout
-            pygame.draw.ellipse(self.image, (128, 0, 128), (20, 10, 8, 6))
-            # Fierce orange eyes
-            pygame.draw.circle(self.image, Colors.ORANGE, (12, 11), 2)
-            pygame.draw.circle(self.image, Colors.ORANGE, (20, 11), 2)
-            pygame.draw.circle(self.image, Colors.RED, (12, 11), 1)
-            pygame.draw.circle(self.image, Colors.RED, (20, 11), 1)
-            # Body (coiled)
-            pygame.draw.ellipse(self.image, (100, 0, 100), (6, 18, 20, 8))
-            # Wings
-            pygame.draw.polygon(self.image, (80, 0, 80), [(4, 20), (2, 16), (8, 18)])
-            pygame.draw.polygon(self.image, (80, 0, 80), [(28, 20), (30, 16), (24, 18)])
-            # Tail
-            pygame.draw.ellipse(self.image, (128, 0, 128), (12, 26, 8, 6))
-            
-        elif self.monster_type == "slime":
-            # Cyan slime - blob-like
-            # Main blob body
-            pygame.draw.ellipse(self.image, (0, 255, 255), (6, 12, 20, 16))
-            # Glossy highlights
-            pygame.draw.ellipse(self.image, (150, 255, 255), (8, 14, 8, 6))
-            # Simple dot eyes
-            pygame.draw.circle(self.image, Colors.BLACK, (12, 18), 2)
-            pygame.draw.circle(self.image, Colors.BLACK, (20, 18), 2)
-            # Small bubbles around it
-            pygame.draw.circle(self.image, (200, 255, 255), (26, 16), 1)
-            pygame.draw.circle(self.image, (200, 255, 255), (6, 20), 1)
-            pygame.draw.circle(self.image, (200, 255, 255), (24, 26), 1)
-            
-        else:
-            # Default monster - mysterious shadow
-            pygame.draw.ellipse(self.image, (64, 0, 64), (8, 8, 16, 20))
-            pygame.draw.circle(self.image, Colors.YELLOW, (12, 14), 2)
-            pygame.draw.circle(self.image, Colors.YELLOW, (20, 14), 2)
-    
+        image = self._surface_cache.get(self.monster_type)
+        if image is None:
+            image = build_monster_surface(self.monster_type)
+            self._surface_cache[self.monster_type] = image
+        self.image = image
+
     def update(self):
+        # Only the floating types animate; everything else is static art
+        if self.monster_type not in ["dragon", "slime"]:
+            return
+
         self.animation_frame += 0.1
-        # Simple floating animation for some monsters
-        if self.monster_type in ["dragon", "slime"]:
-            offset = int(1 * math.sin(self.animation_frame))
-            original_y = getattr(self, 'original_y', self.rect.y)
-            if not hasattr(self, 'original_y'):
-                self.original_y = self.rect.y
-            self.rect.y = self.original_y + offset
+        offset = int(1 * math.sin(self.animation_frame))
+        original_y = getattr(self, 'original_y', self.rect.y)
+        if not hasattr(self, 'original_y'):
+            self.original_y = self.rect.y
+        self.rect.y = self.original_y + offset
 
 
 class LocationSprite(GameSprite):
@@ -501,6 +620,59 @@ class LocationSprite(GameSprite):
             pygame.draw.arc(self.image, Colors.GRAY, (15, 20, 30, 25), 0, 3.14, 3)
 
 
+class SpriteBatch:
+    """Flat batched storage for world sprites.
+
+    Stores sprite images and world coordinates in parallel lists instead of
+    a pygame.sprite.Group, so the per-frame draw culls into one list and
+    issues a single batched blits() call rather than a Python-level blit
+    per sprite.
+    """
+
+    def __init__(self):
+        self.images: list = []
+        self.world_xs: list = []
+        self.world_ys: list = []
+
+    def add(self, sprite) -> None:
+        """Add a sprite's image at its current world position."""
+        self.images.append(sprite.image)
+        self.world_xs.append(sprite.world_x)
+        self.world_ys.append(sprite.world_y)
+
+    def remove(self, index: int) -> None:
+        """Remove the entry at the given batch index."""
+        del self.images[index]
+        del self.world_xs[index]
+        del self.world_ys[index]
+
+    def clear(self) -> None:
+        del self.images[:]
+        del self.world_xs[:]
+        del self.world_ys[:]
+
+    def __len__(self) -> int:
+        return len(self.images)
+
+    def draw(self, surface: pygame.Surface, camera_x: int, camera_y: int,
+             grid_size: int, center_x: int, center_y: int,
+             width: int, height: int) -> None:
+        """Cull to the visible area and blit everything in one batch."""
+        blit_list = []
+        append = blit_list.append
+
+        for image, wx, wy in zip(self.images, self.world_xs, self.world_ys):
+            screen_x = wx * grid_size - camera_x + center_x
+            screen_y = wy * grid_size - camera_y + center_y
+
+            if (-grid_size <= screen_x <= width and
+                -grid_size <= screen_y <= height):
+                append((image, (screen_x, screen_y)))
+
+        if blit_list:
+            surface.blits(blit_list, doreturn=0)
+
+
 class UI:
     
     def __init__(self, screen_width: int, screen_height: int):
@@ -529,112 +701,231 @@ class UI:
         self.notification_timer = 0
         self.current_notification = ""
         
+        # Widgets that currently need per-frame animation ticks; when the
+        # set is empty update_animations is a no-op
+        self._animated_widgets: set = set()
+
+        # Pre-rendered static UI elements (drawn once, blitted per frame)
+        self._compass_cache = self._build_compass_cache()
+        self._combat_panel_bg = self._build_combat_panel_bg()
+
+        # Reusable per-frame surfaces so drawing never allocates
+        self._notif_bg = pygame.Surface((400, 50))
+        self._notif_bg.set_alpha(180)
+        self._combat_panel = pygame.Surface(self._combat_panel_bg.get_size())
+        self._overlay = None  # Sized to the screen on first combat frame
+
+        # Memoized text rendering: repeated strings (names, HP readouts)
+        # skip FreeType rasterization and become a dict lookup + blit
+        self._text_cache = {}
+
+        # Last screen area the notification occupied, for dirty-rect updates
+        self._last_notif_rect = None
+
+        # Specialized combat-panel renderer compiled with layout constants
+        # and helper bindings baked in
+        self._draw_combat_fast = self._compile_combat_panel_draw()
+
+    def _compile_combat_panel_draw(self):
+        """exec-compile the dynamic combat-panel draw with constants inlined.
+
+        The panel layout (text anchors, bar geometry) is fixed data, so the
+        generated function carries it as literals and binds the text cache,
+        fonts, bar helper, and colors as argument defaults — per frame there
+        is no attribute lookup or offset arithmetic left, just the four
+        cached-text blits and two bars.
+        """
+        source = (
+            "def _draw_combat_fast(panel, player, monster,\n"
+            "                      _text=self._text, _bar=self._draw_progress_bar,\n"
+            "                      _fm=self.font_medium, _fs=self.font_small,\n"
+            "                      _cyan=Colors.CYAN, _red=Colors.RED,\n"
+            "                      _white=Colors.WHITE, _hp=Colors.HEALTH_RED):\n"
+            "    panel.blits((\n"
+            "        (_text(_fm, player.name, _cyan), (20, 60)),\n"
+            "        (_text(_fs, 'Health: %d/%d' % (player.health, player.max_health), _white), (20, 85)),\n"
+            "        (_text(_fm, monster.name, _red), (280, 60)),\n"
+            "        (_text(_fs, 'Health: %d/%d' % (monster.health, monster.max_health), _white), (280, 85)),\n"
+            "    ), doreturn=0)\n"
+            "    _bar(panel, 20, 105, 200, 15, player.health, player.max_health, _hp)\n"
+            "    _bar(panel, 280, 105, 200, 15, monster.health, monster.max_health, _hp)\n"
+        )
+        namespace = {"self": self, "Colors": Colors}
+        exec(source, namespace)
+        return namespace["_draw_combat_fast"]
+
+    def _build_compass_cache(self) -> pygame.Surface:
+        """Pre-render the static compass (circle, needle, N label) once.
+
+        The cache includes the "N" label above the dial, so it is 15px
+        taller than the dial itself and gets blitted at (x, y - 15).
+        """
+        radius = 25
+        cache = pygame.Surface((radius * 2, radius * 2 + 15), pygame.SRCALPHA)
+        center = (radius, radius + 15)
+
+        # Background circle
+        pygame.draw.circle(cache, Colors.WHITE, center, radius)
+        pygame.draw.circle(cache, Colors.BLACK, center, radius, 2)
+
+        # North arrow
+        pygame.draw.polygon(cache, Colors.RED, [
+            (center[0], center[1] - radius + 5),
+            (center[0] - 5, center[1] - 5),
+            (center[0] + 5, center[1] - 5)
+        ])
+
+        # Label
+        self.font_small.render_to(cache, (center[0] - 3, 0), "N", Colors.BLACK)
+
+        if pygame.display.get_surface() is not None:
+            cache = cache.convert_alpha()
+        return cache
+
+    def _build_combat_panel_bg(self) -> pygame.Surface:
+        """Pre-render the static parts of the combat panel once.
+
+        Fill, border, title, and option labels never change between
+        frames; only names, HP text, and the health bars are dynamic.
+        """
+        panel_width = 500
+        panel_height = 300
+        bg = pygame.Surface((panel_width, panel_height))
+        bg.fill(Colors.DARK_GRAY)
+        pygame.draw.rect(bg, Colors.WHITE, (0, 0, panel_width, panel_height), 3)
+
+        # Title
+        self.font_large.render_to(bg, (20, 20), "COMBAT", Colors.RED)
+
+        # Combat options
+        y_offset = 180
+        for option in ["1. Attack", "2. Use Item"]:
+            self.font_medium.render_to(bg, (20, y_offset), option, Colors.YELLOW)
+            y_offset += 30
+
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()
+        return bg
+
     def draw_sidebar(self, player) -> pygame.Surface:
         self.sidebar_surface.fill(Colors.DARK_GRAY)
         
-        y_offset = 10
+        # Hold the surface lock across the whole batch of text and bar
+        # draws so SDL does not re-lock per call
+        self.sidebar_surface.lock()
+        try:
+            y_offset = 10
         
-        # Title
-        self.font_large.render_to(self.sidebar_surface, (10, y_offset), 
-                                 "CHARACTER", Colors.GOLD)
-        y_offset += 40
-        
-        # Player name
-        self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
-                                  f"Name: {player.name}", Colors.WHITE)
-        y_offset += 25
-        
-        # Level
-        self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
-                                  f"Level: {player.level}", Colors.CYAN)
-        y_offset += 25
-        
-        # Health bar
-        self.font_small.render_to(self.sidebar_surface, (10, y_offset), 
-                                 "Health:", Colors.WHITE)
-        y_offset += 20
-        self._draw_progress_bar(self.sidebar_surface, 10, y_offset, 200, 15, 
-                               player.health, player.max_health, Colors.HEALTH_RED)
-        self.font_small.render_to(self.sidebar_surface, (10, y_offset + 20), 
-                                 f"{player.health}/{player.max_health}", Colors.WHITE)
-        y_offset += 45
-        
-        # Coins
-        self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
-                                  f"Coins: {player.coins}", Colors.GOLD)
-        y_offset += 25
-        
-        # Attack Power
-        self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
-                                  f"Attack: {player.attack_power}", Colors.RED)
-        y_offset += 25
-        
-        # Position
-        self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
-                                  f" Position: {player.position}", Colors.YELLOW)
-        y_offset += 35
-        
-        # Equipment section
-        self.font_large.render_to(self.sidebar_surface, (10, y_offset), 
-                                 "EQUIPMENT", Colors.GOLD)
-        y_offset += 30
-        
-        equipment_items = [
-            f"Weapon: {player.equipment['weapon']}",
-            f"Armor: {player.equipment['armor']}",
-            f"Accessory: {player.equipment['accessory']}"
-        ]
-        
-        for item in equipment_items:
+            # Title
+            self.font_large.render_to(self.sidebar_surface, (10, y_offset), 
+                                     "CHARACTER", Colors.GOLD)
+            y_offset += 40
+        
+            # Player name
+            self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
+                                      f"Name: {player.name}", Colors.WHITE)
+            y_offset += 25
+        
+            # Level
+            self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
+                                      f"Level: {player.level}", Colors.CYAN)
+            y_offset += 25
+        
+            # Health bar
             self.font_small.render_to(self.sidebar_surface, (10, y_offset), 
-                                     item, Colors.LIGHT_GRAY)
-            y_offset += 18
+                                     "Health:", Colors.WHITE)
+            y_offset += 20
+            self._draw_progress_bar(self.sidebar_surface, 10, y_offset, 200, 15, 
+                                   player.health, player.max_health, Colors.HEALTH_RED)
+            self.font_small.render_to(self.sidebar_surface, (10, y_offset + 20), 
+                                     f"{player.health}/{player.max_health}", Colors.WHITE)
+            y_offset += 45
+        
+            # Coins
+            self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
+                                      f"Coins: {player.coins}", Colors.GOLD)
+            y_offset += 25
         
-        y_offset += 20
+            # Attack Power
+            self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
+                                      f"Attack: {player.attack_power}", Colors.RED)
+            y_offset += 25
+        
+            # Position
+            self.font_medium.render_to(self.sidebar_surface, (10, y_offset), 
+                                      f" Position: {player.position}", Colors.YELLOW)
+            y_offset += 35
+        
+            # Equipment section
+            self.font_large.render_to(self.sidebar_surface, (10, y_offset), 
+                                     "EQUIPMENT", Colors.GOLD)
+            y_offset += 30
         
-        # Inventory section
-        self.font_large.render_to(self.sidebar_surface, (10, y_offset), 
-                                 "INVENTORY", Colors.GOLD)
-        y_offset += 30
+            equipment_items = [
+                f"Weapon: {player.equipment['weapon']}",
+                f"Armor: {player.equipment['armor']}",
+                f"Accessory: {player.equipment['accessory']}"
+            ]
         
-        if player.inventory:
-            for i, item in enumerate(player.inventory[:8]):  # Show max 8 items
+            for item in equipment_items:
                 self.font_small.render_to(self.sidebar_surface, (10, y_offset), 
-                                         f"{i+1}. {item}", Colors.LIGHT_GRAY)
+                                         item, Colors.LIGHT_GRAY)
                 y_offset += 18
-        else:
-            self.font_small.render_to(self.sidebar_surface, (10, y_offset), 
-                                     "Empty", Colors.GRAY)
+        
+            y_offset += 20
+        
+            # Inventory section
+            self.font_large.render_to(self.sidebar_surface, (10, y_offset), 
+                                     "INVENTORY", Colors.GOLD)
+            y_offset += 30
+        
+            if player.inventory:
+                for i, item in enumerate(player.inventory[:8]):  # Show max 8 items
+                    self.font_small.render_to(self.sidebar_surface, (10, y_offset), 
+                                             f"{i+1}. {item}", Colors.LIGHT_GRAY)
+                    y_offset += 18
+            else:
+                self.font_small.render_to(self.sidebar_surface, (10, y_offset), 
+                                         "Empty", Colors.GRAY)
+        
+        finally:
+            self.sidebar_surface.unlock()
         
         return self.sidebar_surface
     
     def draw_bottom_panel(self, messages: list, current_location: str) -> pygame.Surface:
         self.bottom_panel_surface.fill(Colors.BLACK)
         
-        # Draw border
-        pygame.draw.rect(self.bottom_panel_surface, Colors.WHITE, 
-                        (0, 0, self.game_area_width, self.bottom_panel_height), 2)
+        # Single lock for the border and all text draws
+        self.bottom_panel_surface.lock()
+        try:
+            # Draw border
+            pygame.draw.rect(self.bottom_panel_surface, Colors.WHITE, 
+                            (0, 0, self.game_area_width, self.bottom_panel_height), 2)
+        
+            # Location info
+            self.font_medium.render_to(self.bottom_panel_surface, (10, 10), 
+                                      f"Current Location: {current_location}", Colors.CYAN)
         
-        # Location info
-        self.font_medium.render_to(self.bottom_panel_surface, (10, 10), 
-                                  f"Current Location: {current_location}", Colors.CYAN)
+            # Messages
+            self.font_small.render_to(self.bottom_panel_surface, (10, 40), 
+                                     "Recent Events:", Colors.YELLOW)
         
-        # Messages
-        self.font_small.render_to(self.bottom_panel_surface, (10, 40), 
-                                 "Recent Events:", Colors.YELLOW)
+            # Show last 6 messages
+            y_offset = 60
+            for message in messages[-6:]:
+                if y_offset < self.bottom_panel_height - 15:
+                    self.font_small.render_to(self.bottom_panel_surface, (10, y_offset), 
+                                             message[:80], Colors.WHITE)  # Truncate long messages
+                    y_offset += 15
         
-        # Show last 6 messages
-        y_offset = 60
-        for message in messages[-6:]:
-            if y_offset < self.bottom_panel_height - 15:
-                self.font_small.render_to(self.bottom_panel_surface, (10, y_offset), 
-                                         message[:80], Colors.WHITE)  # Truncate long messages
-                y_offset += 15
+        finally:
+            self.bottom_panel_surface.unlock()
         
         return self.bottom_panel_surface
     
     def draw_game_area(self, camera_x: int, camera_y: int, 
-                      world_sprites: pygame.sprite.Group, 
+                      world_sprites, 
                       player_sprite: PlayerSprite) -> pygame.Surface:
         self.game_surface.fill(Colors.GRASS_GREEN)
         
@@ -651,17 +942,23 @@ class UI:
         center_x = self.game_area_width // 2
         center_y = self.game_area_height // 2
         
-        # Draw world sprites
-        for sprite in world_sprites:
-            screen_x = sprite.world_x * grid_size - camera_x + center_x
-            screen_y = sprite.world_y * grid_size - camera_y + center_y
-            
-            # Only draw if on screen
-            if (-grid_size <= screen_x <= self.game_area_width and 
-                -grid_size <= screen_y <= self.game_area_height):
-                sprite.rect.x = screen_x
-                sprite.rect.y = screen_y
-                self.game_surface.blit(sprite.image, sprite.rect)
+        # Draw world sprites in one batched call
+        if isinstance(world_sprites, SpriteBatch):
+            world_sprites.draw(self.game_surface, camera_x, camera_y, grid_size,
+                               center_x, center_y,
+                               self.game_area_width, self.game_area_height)
+        else:
+            # Legacy pygame.sprite.Group path
+            for sprite in world_sprites:
+                screen_x = sprite.world_x * grid_size - camera_x + center_x
+                screen_y = sprite.world_y * grid_size - camera_y + center_y
+                
+                # Only draw if on screen
+                if (-grid_size <= screen_x <= self.game_area_width and 
+                    -grid_size <= screen_y <= self.game_area_height):
+                    sprite.rect.x = screen_x
+                    sprite.rect.y = screen_y
+                    self.game_surface.blit(sprite.image, sprite.rect)
         
         # Draw player in center
         player_sprite.rect.x = center_x - 16  # Center the 32x32 player sprite
@@ -676,112 +973,112 @@ class UI:
     def _draw_progress_bar(self, surface: pygame.Surface, x: int, y: int, 
                           width: int, height: int, current: int, maximum: int, 
                           color):
-        # Background
-        pygame.draw.rect(surface, Colors.DARK_GRAY, (x, y, width, height))
-        
-        # Border
-        pygame.draw.rect(surface, Colors.WHITE, (x, y, width, height), 1)
-        
+        # Surface.fill is cheaper than draw.rect for axis-aligned solid
+        # rects; the white border is the background showing through a
+        # 1px inset, so the bar costs two fills plus the value fill
+        surface.fill(Colors.WHITE, (x, y, width, height))
+        surface.fill(Colors.DARK_GRAY, (x + 1, y + 1, width - 2, height - 2))
+
         # Fill
         if maximum > 0:
             fill_width = int((current / maximum) * (width - 2))
-            pygame.draw.rect(surface, color, (x + 1, y + 1, fill_width, height - 2))
+            if fill_width > 0:
+                surface.fill(color, (x + 1, y + 1, fill_width, height - 2))
     
+    def _text(self, font: pygame.freetype.Font, text: str, color) -> pygame.Surface:
+        """Render text through a small memo cache keyed by (size, text, color)."""
+        key = (font.size, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            surf, _ = font.render(text, color)
+            self._text_cache[key] = surf
+        return surf
+
     def _draw_compass(self, x: int, y: int):
-        radius = 25
-        center = (x + radius, y + radius)
-        
-        # Background circle
-        pygame.draw.circle(self.game_surface, Colors.WHITE, center, radius)
-        pygame.draw.circle(self.game_surface, Colors.BLACK, center, radius, 2)
-        
-        # North arrow
-        pygame.draw.polygon(self.game_surface, Colors.RED, [
-            (center[0], center[1] - radius + 5),
-            (center[0] - 5, center[1] - 5),
-            (center[0] + 5, center[1] - 5)
-        ])
-        
-        # Labels
-        self.font_small.render_to(self.game_surface, (center[0] - 3, center[1] - radius - 15), 
-                                 "N", Colors.BLACK)
+        # Static dial pre-rendered in __init__; the cache carries the "N"
+        # label above the circle, hence the 15px upward shift
+        self.game_surface.blit(self._compass_cache, (x, y - 15))
     
     def show_notification(self, message: str, duration: int = 3000):
         self.current_notification = message
         self.notification_timer = pygame.time.get_ticks() + duration
     
     def draw_notifications(self, surface: pygame.Surface):
+        """Draw the active notification and return the screen area it touched.
+
+        Returns the destination Rect while a notification is visible, the
+        stale Rect once right after it expires (so the caller can repaint
+        over it), and None otherwise.  Callers on mostly-static screens can
+        feed the result to pygame.display.update() instead of flipping the
+        whole framebuffer.
+        """
         if self.current_notification and pygame.time.get_ticks() < self.notification_timer:
-            # Create semi-transparent background
-            notification_surface = pygame.Surface((400, 50))
-            notification_surface.set_alpha(180)
+            # Reuse the semi-transparent background surface
+            notification_surface = self._notif_bg
             notification_surface.fill(Colors.BLACK)
             
             # Draw notification text
-            text_surface, _ = self.font_medium.render(self.current_notification, Colors.WHITE)
+            text_surface = self._text(self.font_medium, self.current_notification, Colors.WHITE)
             text_rect = text_surface.get_rect(center=(200, 25))
             notification_surface.blit(text_surface, text_rect)
             
             # Position at top center of screen
             x = (surface.get_width() - 400) // 2
             surface.blit(notification_surface, (x, 50))
+            self._last_notif_rect = pygame.Rect(x, 50, 400, 50)
+            return self._last_notif_rect
+        
+        if self._last_notif_rect is not None:
+            # Notification just expired; report its area one last time
+            stale_rect = self._last_notif_rect
+            self._last_notif_rect = None
+            return stale_rect
+        
+        return None
     
     def draw_combat_overlay(self, surface: pygame.Surface, player, monster):
-        # Semi-transparent background
-        overlay = pygame.Surface((surface.get_width(), surface.get_height()))
-        overlay.set_alpha(128)
-        overlay.fill(Colors.BLACK)
-        surface.blit(overlay, (0, 0))
+        # Semi-transparent background, created once and reused
+        if self._overlay is None or self._overlay.get_size() != surface.get_size():
+            self._overlay = pygame.Surface(surface.get_size())
+            self._overlay.set_alpha(128)
+            self._overlay.fill(Colors.BLACK)
+        surface.blit(self._overlay, (0, 0))
         
         # Combat panel
-        panel_width = 500
-        panel_height = 300
+        panel_width, panel_height = self._combat_panel.get_size()
         panel_x = (surface.get_width() - panel_width) // 2
         panel_y = (surface.get_height() - panel_height) // 2
         
-        combat_panel = pygame.Surface((panel_width, panel_height))
-        combat_panel.fill(Colors.DARK_GRAY)
-        pygame.draw.rect(combat_panel, Colors.WHITE, (0, 0, panel_width, panel_height), 3)
+        combat_panel = self._combat_panel
+        combat_panel.blit(self._combat_panel_bg, (0, 0))
+
+        # Dynamic stats and bars via the compiled specialized renderer
+        self._draw_combat_fast(combat_panel, player, monster)
         
-        # Title
-        self.font_large.render_to(combat_panel, (20, 20), "COMBAT", Colors.RED)
-        
-        # Player stats
-        y_offset = 60
-        self.font_medium.render_to(combat_panel, (20, y_offset), 
-                                  f"{player.name}", Colors.CYAN)
-        y_offset += 25
-        self.font_small.render_to(combat_panel, (20, y_offset), 
-                                 f"Health: {player.health}/{player.max_health}", Colors.WHITE)
-        
-        # Player health bar
-        y_offset += 20
-        self._draw_progress_bar(combat_panel, 20, y_offset, 200, 15, 
-                               player.health, player.max_health, Colors.HEALTH_RED)
-        
-        # Monster stats  
-        y_offset = 60
-        self.font_medium.render_to(combat_panel, (280, y_offset), 
-                                  f"{monster.name}", Colors.RED)
-        y_offset += 25
-        self.font_small.render_to(combat_panel, (280, y_offset), 
-                                 f"Health: {monster.health}/{monster.max_health}", Colors.WHITE)
-        
-        # Monster health bar
-        y_offset += 20
-        self._draw_progress_bar(combat_panel, 280, y_offset, 200, 15, 
-                               monster.health, monster.max_health, Colors.HEALTH_RED)
-        
-        # Combat options
-        y_offset = 180
-        options = ["1. Attack", "2. Use Item"]
-        for option in options:
-            self.font_medium.render_to(combat_panel, (20, y_offset), option, Colors.YELLOW)
-            y_offset += 30
+        # Recent combat log entries (strings repeat, so the text cache
+        # makes these nearly free)
+        log_y = 235
+        for message in list(combat_log)[-4:]:
+            combat_panel.blit(self._text(self.font_small, message, Colors.LIGHT_GRAY),
+                              (20, log_y))
+            log_y += 16
         
         surface.blit(combat_panel, (panel_x, panel_y))
     
+    def register_anim(self, widget) -> None:
+        """Mark a widget as animating so update_animations does work."""
+        self._animated_widgets.add(widget)
+    
+    def unregister_anim(self, widget) -> None:
+        """Remove a widget from the animation set (e.g. when hidden)."""
+        self._animated_widgets.discard(widget)
+    
     def update_animations(self):
+        # Dead-work elimination: nothing registered means nothing blinks
+        if not self._animated_widgets:
+            return
         self.blink_timer += 1
         if self.blink_timer > 60:  # Reset every second at 60 FPS
             self.blink_timer = 0
@@ -789,11 +1086,15 @@ class UI:
 
 def test_graphics_engine():
     print("Testing Graphics Engine...")
-    
-    pygame.init()
-    screen = pygame.display.set_mode((800, 600))
-    pygame.display.set_caption("Graphics Engine Test")
-    
+
+    # Reuse a display the caller already set up (e.g. the pytest
+    # session fixture); SDL bring-up is only paid when run standalone
+    owns_display = pygame.display.get_surface() is None
+    if owns_display:
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        pygame.display.set_caption("Graphics Engine Test")
+
     # Test UI creation
     ui = UI(800, 600)
     assert ui.sidebar_width == 250, "UI sidebar width incorrect"
@@ -809,11 +1110,18 @@ def test_graphics_engine():
     assert goblin_sprite.monster_type == "goblin", "Monster type incorrect"
     print("✓ Monster sprite test passed")
     
-    pygame.quit()
+    if owns_display:
+        pygame.quit()
     print("All Graphics Engine tests passed\n")
 
 
 def create_simple_sprites():
+    """Build the small pickup/decoration sprites, preconverted for blitting.
+
+    When a display exists the surfaces are convert()ed to its pixel
+    format so later blits skip per-call conversion; headless callers
+    (tests) still get usable raw surfaces.
+    """
     sprites = {}
     
     # Create coin sprite
@@ -837,5 +1145,14 @@ def create_simple_sprites():
     pygame.draw.circle(tree_sprite, Colors.GREEN, (16, 20), 12)   # Leaves
     sprites['tree'] = tree_sprite
     
+    # Match the display format once so every later blit is a plain copy
+    if pygame.display.get_surface() is not None:
+        for name, sprite in sprites.items():
+            colorkey = sprite.get_colorkey()
+            converted = sprite.convert()
+            if colorkey is not None:
+                converted.set_colorkey(colorkey)
+            sprites[name] = converted
+    
     return sprites
 
@@ -1,5 +1,34 @@
+import bisect
 import random
 from abc import ABC, abstractmethod
+from collections import deque
+
+
+# Rolling log of combat messages, rendered by the UI. Appending here is
+# far cheaper than print() in the per-hit path; set COMBAT_DEBUG to True
+# to also echo every message to stdout.
+combat_log: deque = deque(maxlen=50)
+COMBAT_DEBUG = False
+
+# Lifetime count of logged messages. The deque evicts old entries once
+# full, so callers that want "what did this round add" must diff this
+# counter rather than index the deque by its length.
+_log_count = 0
+
+
+# Local bindings of the RNG entry points: avoids the global + attribute
+# lookup on every call in the combat hot path
+_random = random.random
+_randrange = random.randrange
+
+
+def log_combat(message: str) -> None:
+    """Record a combat message for on-screen display."""
+    global _log_count
+    combat_log.append(message)
+    _log_count += 1
+    if COMBAT_DEBUG:
+        print(message)
 
 
 class Monster(ABC):
@@ -9,6 +38,9 @@ class Monster(ABC):
     including health management, attack mechanics, and special abilities.
     Uses abstract methods to enforce implementation in subclasses.
     """
+    __slots__ = ("name", "health", "max_health", "attack", "coins_reward",
+                 "is_alive", "defense", "speed", "magic_resistance")
+    
     def __init__(self, name: str, health: int, attack: int, coins_reward: int):
         """Initialize a monster with basic stats.
         
@@ -25,13 +57,26 @@ class Monster(ABC):
         self.coins_reward: int = coins_reward
         self.is_alive: bool = True
         
-        # Dictionary for monster stats and resistances
-        self.stats: dict = {
-            "defense": 0,
-            "speed": random.randint(1, 10),
-            "magic_resistance": 0
+        # Stats and resistances as direct attributes (hot path in combat)
+        self.defense: int = 0
+        self.speed: int = random.randint(1, 10)
+        self.magic_resistance: int = 0
+    
+    @property
+    def stats(self) -> dict:
+        """Dict view of the monster's stats, kept for legacy callers."""
+        return {
+            "defense": self.defense,
+            "speed": self.speed,
+            "magic_resistance": self.magic_resistance
         }
     
+    def _reset(self) -> None:
+        """Restore a pooled monster to a freshly-spawned state in place."""
+        self.health = self.max_health
+        self.is_alive = True
+        self.speed = random.randint(1, 10)
+    
     @abstractmethod
     def special_ability(self) -> int:
         """Abstract method for monster special abilities.
@@ -53,76 +98,96 @@ class Monster(ABC):
             bool: True if monster survives, False if defeated
         """
         # Calculate actual damage with defense
-        actual_damage = max(1, damage - self.stats["defense"])
+        actual_damage = max(1, damage - self.defense)
         self.health -= actual_damage
         
         if self.health <= 0:
             self.health = 0
             self.is_alive = False
-            print(f"{self.name} has been defeated!")
+            log_combat(f"{self.name} has been defeated!")
             return False
         else:
-            print(f"{self.name} took {actual_damage} damage. Health: {self.health}/{self.max_health}")
+            log_combat(f"{self.name} took {actual_damage} damage. Health: {self.health}/{self.max_health}")
             return True
     
     def attack_player(self) -> int:
         base_damage = self.attack
-        variation = random.randint(-2, 3)  # Random damage variation
+        variation = _randrange(-2, 4)  # Random damage variation
         final_damage = max(1, base_damage + variation)
         
-        print(f"{self.name} attacks for {final_damage} damage!")
+        log_combat(f"{self.name} attacks for {final_damage} damage!")
         return final_damage
 
 
 class Goblin(Monster):
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("Goblin", 30, 5, 15)
-        self.stats["speed"] = random.randint(6, 10)  # Goblins are fast
+        self.speed = random.randint(6, 10)  # Goblins are fast
+        
+    def _reset(self) -> None:
+        super()._reset()
+        self.speed = random.randint(6, 10)  # Goblins are fast
         
     def special_ability(self) -> int:
-        if random.random() < 0.3:  # 30% chance
-            print(f"{self.name} uses Quick Strike!")
+        if _random() < 0.3:  # 30% chance
+            log_combat(f"{self.name} uses Quick Strike!")
             return self.attack * 2
         return self.attack
 
 
 class Orc(Monster):
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("Orc", 60, 8, 30)
-        self.stats["defense"] = 2
-        self.stats["speed"] = random.randint(1, 4)  # Orcs are slow
+        self.defense = 2
+        self.speed = random.randint(1, 4)  # Orcs are slow
+        
+    def _reset(self) -> None:
+        super()._reset()
+        self.speed = random.randint(1, 4)  # Orcs are slow
         
     def special_ability(self) -> int:
-        if random.random() < 0.25:  # 25% chance
-            print(f"{self.name} uses Brutal Slam!")
+        if _random() < 0.25:  # 25% chance
+            log_combat(f"{self.name} uses Brutal Slam!")
             return self.attack * 3
         return self.attack
 
 
 class Dragon(Monster):
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("Dragon", 120, 15, 100)
-        self.stats["defense"] = 5
-        self.stats["magic_resistance"] = 8
-        self.stats["speed"] = random.randint(5, 8)
+        self.defense = 5
+        self.magic_resistance = 8
+        self.speed = random.randint(5, 8)
+        
+    def _reset(self) -> None:
+        super()._reset()
+        self.speed = random.randint(5, 8)
         
     def special_ability(self) -> int:
-        if random.random() < 0.4:  # 40% chance
-            print(f"{self.name} breathes fire!")
+        if _random() < 0.4:  # 40% chance
+            log_combat(f"{self.name} breathes fire!")
             return self.attack * 2
         return self.attack
 
 
 class Slime(Monster):
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("Slime", 25, 5, 10)
-        self.stats["magic_resistance"] = 3
+        self.magic_resistance = 3
         
     def special_ability(self) -> int:
-        if random.random() < 0.2 and self.health < self.max_health:  # 20% chance
+        if _random() < 0.2 and self.health < self.max_health:  # 20% chance
             heal_amount = 5
             self.health = min(self.max_health, self.health + heal_amount)
-            print(f"💚 {self.name} regenerates {heal_amount} health!")
+            log_combat(f"💚 {self.name} regenerates {heal_amount} health!")
         return self.attack
 
 
@@ -143,6 +208,9 @@ class MonsterFactory:
         ("dragon", 5)    # 5% chance
     ]
     
+    # Free lists of released monsters, reused instead of re-allocating
+    _pools: dict = {name: [] for name in monster_types}
+    
     @classmethod
     def create_monster(cls, monster_type: str = None, player_level: int = 1) -> Monster:
         if monster_type is None:
@@ -150,100 +218,143 @@ class MonsterFactory:
         
         monster_type = monster_type.lower()
         
-        if monster_type in cls.monster_types:
-            return cls.monster_types[monster_type]()
-        else:
+        if monster_type not in cls.monster_types:
             print(f"Unknown monster type: {monster_type}")
-            return cls.monster_types["goblin"]()  # Default to goblin
+            monster_type = "goblin"  # Default to goblin
+        
+        # Reuse a pooled instance when one is available
+        pool = cls._pools[monster_type]
+        if pool:
+            monster = pool.pop()
+            monster._reset()
+            return monster
+        return cls.monster_types[monster_type]()
     
     @classmethod
-    def get_random_monster_type(cls, player_level: int = 1) -> str:
-        # Level-based monster spawning
+    def release(cls, monster: Monster) -> None:
+        """Return a monster to its type pool so create_monster can reuse it."""
+        pool = cls._pools.get(monster.name.lower())
+        if pool is not None and monster not in pool:
+            pool.append(monster)
+    
+    # Level-tier spawn tables: population and cumulative percentage weights
+    # (e.g. early game is 60% goblin / 40% slime)
+    _EARLY_POP = ("goblin", "slime")
+    _EARLY_CUM = (60, 100)
+    _MID_POP = ("goblin", "slime", "orc")
+    _MID_CUM = (40, 75, 100)
+    _LATE_POP = ("goblin", "slime", "orc", "dragon")
+    _LATE_CUM = (30, 55, 90, 100)
+    
+    @classmethod
+    def _tier(cls, player_level: int) -> tuple:
+        """Return the (cumulative weights, population) pair for a level tier."""
         if player_level <= 2:
             # Early game: only goblins and slimes
-            weighted_list = ["goblin"] * 60 + ["slime"] * 40
+            return cls._EARLY_CUM, cls._EARLY_POP
         elif player_level <= 5:
             # Mid game: goblins, slimes, and some orcs
-            weighted_list = ["goblin"] * 40 + ["slime"] * 35 + ["orc"] * 25
+            return cls._MID_CUM, cls._MID_POP
         else:
             # Late game: all monsters including dragons
-            weighted_list = ["goblin"] * 30 + ["slime"] * 25 + ["orc"] * 35 + ["dragon"] * 10
-        
-        return random.choice(weighted_list)
+            return cls._LATE_CUM, cls._LATE_POP
+    
+    @classmethod
+    def get_random_monster_type(cls, player_level: int = 1) -> str:
+        # Level-based monster spawning: one bisect into the precomputed
+        # cumulative weight table, no per-call list building
+        cum, pop = cls._tier(player_level)
+        return pop[bisect.bisect_right(cum, random.random() * cum[-1])]
     
     @classmethod
     def get_all_monster_types(cls) -> list:
         return list(cls.monster_types.keys())
 
 
-def combat_encounter(player, monster: Monster) -> bool:
+def start_combat(player, monster: Monster) -> None:
+    """Put the player into combat without blocking the caller.
+
+    Event-driven front ends (the pygame loop) call this when a monster is
+    engaged, then feed one player_action() per keystroke so rendering
+    keeps running at full frame rate between turns.
+    """
     print(f"\nCombat begins! {player.name} vs {monster.name}")
     print(f"Monster Health: {monster.health}")
     print(f"Your Health: {player.health}")
-    
     player.in_combat = True
-    
-    # Main combat loop (requirement: while loop)
-    while player.is_alive and monster.is_alive:
-        print("\n" + "-"*20)
-        print("Choose your action:")
-        print("1. Attack")
-        print("2. Use Item")
-        print("3. Try to Flee")
-        
-        try:
-            choice = input("Enter choice (1-3): ").strip()
-        except (EOFError, KeyboardInterrupt):
-            choice = "3"  # Default to flee if input fails
+
+
+def player_action(player, monster: Monster, action: str, item_name: str = None) -> str:
+    """Resolve one combat round for the given player action.
+
+    Args:
+        player: The player in combat
+        monster (Monster): The engaged monster
+        action (str): "attack", "item", or "flee"
+        item_name (str): Inventory item to use when action is "item"
+
+    Returns:
+        str: "ongoing", "victory", "defeat", or "fled"
+    """
+    if action == "attack":
+        # Player attacks
+        damage = player.attack_power + random.randint(-2, 3)
+        print(f"You attack {monster.name} for {damage} damage!")
+        monster.take_damage(damage)
         
-        # Player action phase
-        if choice == "1":
-            # Player attacks
-            damage = player.attack_power + random.randint(-2, 3)
-            print(f"You attack {monster.name} for {damage} damage!")
-            monster.take_damage(damage)
+    elif action == "item":
+        # Use item; an invalid or failed item skips the monster's turn,
+        # matching the original flow
+        if item_name is None or not player.use_item(item_name):
+            return "ongoing"
             
-        elif choice == "2":
-            # Use item
-            if player.inventory:  # Check if inventory is not empty
-                print(f"Inventory: {', '.join(player.inventory)}")
-                item = input("Enter item name: ").strip()
-                if not player.use_item(item):
-                    continue  # Skip monster turn if invalid item
-            else:
-                print("Your inventory is empty!")
-                continue  # Skip monster turn
-                
-        elif choice == "3":
-            # Try to flee
-            flee_chance = 0.5  # 50% base flee chance
-            if player.position[0] == 0 and player.position[1] == 0:  # At spawn
-                flee_chance = 0.8  # Higher chance at spawn
-                
-            if random.random() < flee_chance:
-                print("You successfully fled from combat!")
-                player.in_combat = False
-                return False  # Combat ended, no winner
-            else:
-                print("You failed to escape!")
-                
+    elif action == "flee":
+        # Try to flee
+        flee_chance = 0.5  # 50% base flee chance
+        if player.position[0] == 0 and player.position[1] == 0:  # At spawn
+            flee_chance = 0.8  # Higher chance at spawn
+            
+        if random.random() < flee_chance:
+            print("You successfully fled from combat!")
+            player.in_combat = False
+            return "fled"
         else:
-            print("Invalid choice! You lose your turn.")
-        
-        # Monster action phase (if monster is still alive)
-        if monster.is_alive:
-            # 50% chance for special ability, otherwise normal attack
-            if random.random() < 0.5:
-                damage = monster.special_ability()
-            else:
-                damage = monster.attack_player()
+            print("You failed to escape!")
             
-            player.take_damage(damage)
+    else:
+        print("Invalid choice! You lose your turn.")
     
+    # Monster action phase (if monster is still alive)
+    if monster.is_alive:
+        # 50% chance for special ability, otherwise normal attack
+        if random.random() < 0.5:
+            damage = monster.special_ability()
+        else:
+            damage = monster.attack_player()
+        
+        player.take_damage(damage)
+    
+    if not player.is_alive:
+        return "defeat"
+    if not monster.is_alive:
+        return "victory"
+    return "ongoing"
+
+
+def end_combat(player, monster: Monster, outcome: str) -> bool:
+    """Apply combat resolution and rewards for a finished encounter.
+
+    Args:
+        player: The player who was in combat
+        monster (Monster): The monster that was fought
+        outcome (str): Final status from player_action
+
+    Returns:
+        bool: True if the player won, False otherwise
+    """
     player.in_combat = False
     
-    # Combat resolution
-    if player.is_alive and not monster.is_alive:
+    if outcome == "victory":
         print(f"\nVictory! You defeated the {monster.name}!")
         
         # Reward calculation
@@ -260,14 +371,64 @@ def combat_encounter(player, monster: Monster) -> bool:
             player.add_to_inventory(item_found)
             print(f"You found a {item_found}!")
         
+        # Defeated monsters go back to the factory pool for reuse
+        MonsterFactory.release(monster)
         return True
-    elif not player.is_alive:
+    elif outcome == "defeat":
         print(f"\nDefeat! You were slain by the {monster.name}...")
         return False
     else:
         return False  # Fled or other outcome
 
 
+def combat_encounter(player, monster: Monster) -> bool:
+    """Text-mode combat wrapper that drives the round helpers with input().
+
+    The blocking prompt lives only here; the graphical game dispatches
+    player_action from its own event loop instead.
+    """
+    start_combat(player, monster)
+    
+    outcome = "ongoing"
+    # Main combat loop (requirement: while loop)
+    while outcome == "ongoing":
+        print("\n" + "-"*20)
+        print("Choose your action:")
+        print("1. Attack")
+        print("2. Use Item")
+        print("3. Try to Flee")
+        
+        try:
+            choice = input("Enter choice (1-3): ").strip()
+        except (EOFError, KeyboardInterrupt):
+            choice = "3"  # Default to flee if input fails
+        
+        logged_before = _log_count
+        if choice == "1":
+            outcome = player_action(player, monster, "attack")
+        elif choice == "2":
+            if player.inventory:  # Check if inventory is not empty
+                print(f"Inventory: {', '.join(player.inventory)}")
+                item = input("Enter item name: ").strip()
+                outcome = player_action(player, monster, "item", item)
+            else:
+                print("Your inventory is empty!")
+        elif choice == "3":
+            outcome = player_action(player, monster, "flee")
+        else:
+            outcome = player_action(player, monster, choice)
+        
+        # Text mode still narrates each round: echo what the round logged,
+        # counted against the lifetime total since the deque evicts old
+        # entries once it fills
+        new_messages = _log_count - logged_before
+        if new_messages:
+            for message in list(combat_log)[-new_messages:]:
+                print(message)
+    
+    return end_combat(player, monster, outcome)
+
+
 def test_monster_system():
     print("Testing Monster system...")
     
@@ -1,5 +1,32 @@
 import random
 
+from monsters import log_combat
+
+
+def _pack(x: int, y: int) -> int:
+    """Pack a signed coordinate pair into one 64-bit int (32 bits per axis)."""
+    return ((x & 0xffffffff) << 32) | (y & 0xffffffff)
+
+
+def _unpack(packed: int) -> tuple:
+    """Invert _pack, restoring the signed (x, y) pair."""
+    x = packed >> 32
+    y = packed & 0xffffffff
+    if x >= 0x80000000:
+        x -= 0x100000000
+    if y >= 0x80000000:
+        y -= 0x100000000
+    return (x, y)
+
+
+# Direction name -> (dx, dy) lookup shared by Player.move
+_DIRS = {
+    "north": (0, 1), "n": (0, 1),
+    "south": (0, -1), "s": (0, -1),
+    "east": (1, 0), "e": (1, 0),
+    "west": (-1, 0), "w": (-1, 0),
+}
+
 
 class Player:
     """Represents the player character in the RPG.
@@ -8,6 +35,21 @@ class Player:
     Demonstrates multiple Python data types including strings, integers, floats,
     dictionaries, lists, tuples, sets, and booleans.
     """
+    __slots__ = (
+        "name", "health", "max_health", "coins", "level", "experience",
+        "attack_power", "equipment", "inventory", "position",
+        "visited_locations", "is_alive", "in_combat",
+        "_visited_dirty", "_visited_cache",
+    )
+    
+    # Consumable handlers keyed by normalized item name. A dict lookup
+    # replaces the chained lower()/compare branches in use_item; items
+    # without an entry cannot be consumed.
+    _USE_HANDLERS = {
+        "health potion": lambda player: player.heal(30),
+        "bread": lambda player: player.heal(10),
+    }
+    
     def __init__(self, name: str = "Hero"):
         """Initialize a new player with default stats and equipment.
         
@@ -36,8 +78,13 @@ class Player:
         # Tuple for position coordinates (requirement: sequence data type)
         self.position = (0, 0)
         
-        # Set for visited locations (requirement: sequence data type)
-        self.visited_locations: set = {(0, 0)}
+        # Set for visited locations, stored as packed 64-bit ints — far
+        # smaller and faster to hash than a set of (x, y) tuples
+        self.visited_locations: set = {_pack(0, 0)}
+        
+        # Serialized form of visited_locations, rebuilt only when it changes
+        self._visited_dirty: bool = True
+        self._visited_cache: str = ""
         
         # Boolean variables for game states
         self.is_alive: bool = True
@@ -58,22 +105,18 @@ class Player:
         x, y = self.position
         old_position = self.position
         
-        # Branching logic (requirement: multiple if statements)
-        if direction.lower() == "north" or direction.lower() == "n":
-            y += 1
-        elif direction.lower() == "south" or direction.lower() == "s":
-            y -= 1
-        elif direction.lower() == "east" or direction.lower() == "e":
-            x += 1
-        elif direction.lower() == "west" or direction.lower() == "w":
-            x -= 1
-        else:
+        # Single table lookup instead of chained string comparisons
+        delta = _DIRS.get(direction.lower())
+        if delta is None:
             print("Invalid direction! Use north, south, east, or west.")
             return self.position
             
         # Update position and add to visited locations
-        self.position = (x, y)
-        self.visited_locations.add(self.position)
+        self.position = (x + delta[0], y + delta[1])
+        packed = _pack(self.position[0], self.position[1])
+        if packed not in self.visited_locations:
+            self.visited_locations.add(packed)
+            self._visited_dirty = True
         
         print(f"You moved {direction} from {old_position} to {self.position}")
         return self.position
@@ -119,10 +162,10 @@ class Player:
         if self.health <= 0:
             self.health = 0
             self.is_alive = False
-            print(f"{self.name} has been defeated!")
+            log_combat(f"{self.name} has been defeated!")
             return False
         else:
-            print(f"You took {damage} damage. Health: {self.health}/{self.max_health}")
+            log_combat(f"You took {damage} damage. Health: {self.health}/{self.max_health}")
             return True
     
     def heal(self, amount: int) -> None:
@@ -151,19 +194,15 @@ class Player:
         """
         # Check if item exists in inventory (using list method)
         if item_name in self.inventory:
-            self.inventory.remove(item_name)  # List method
-            
-            # Nested branching logic
-            if item_name.lower() == "health potion":
-                self.heal(30)
-                return True
-            elif item_name.lower() == "bread":
-                self.heal(10)
-                return True
-            else:
+            # Table dispatch: normalize once, then a single dict lookup
+            handler = self._USE_HANDLERS.get(item_name.lower())
+            if handler is None:
                 print(f"You don't know how to use {item_name}")
-                self.inventory.append(item_name)  # Put it back
                 return False
+            
+            self.inventory.remove(item_name)  # List method
+            handler(self)
+            return True
         else:
             print(f"You don't have {item_name} in your inventory")
             return False
@@ -205,9 +244,17 @@ class Player:
             "equipment_armor": self.equipment["armor"],
             "equipment_accessory": self.equipment["accessory"],
             "inventory": "|".join(self.inventory),  # Convert list to string
-            "visited_locations": "|".join([f"{x},{y}" for x, y in self.visited_locations])
+            "visited_locations": self._serialize_visited()
         }
     
+    def _serialize_visited(self) -> str:
+        # Reserialize only when the set changed since the last save
+        if self._visited_dirty:
+            self._visited_cache = "|".join(
+                f"{x},{y}" for x, y in map(_unpack, self.visited_locations))
+            self._visited_dirty = False
+        return self._visited_cache
+    
     def load_save_data(self, data: dict) -> None:
         try:
             self.name = data.get("name", "Hero")
@@ -236,7 +283,8 @@ class Player:
             locations_str = data.get("visited_locations", "0,0")
             if locations_str:
                 locations = [loc.split(",") for loc in locations_str.split("|")]
-                self.visited_locations = {(int(x), int(y)) for x, y in locations}
+                self.visited_locations = {_pack(int(x), int(y)) for x, y in locations}
+                self._visited_dirty = True
             
         except (ValueError, KeyError) as e:
             print(f"Error loading save data: {e}")
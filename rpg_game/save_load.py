@@ -1,16 +1,33 @@
 import csv
+import io
+import json
 import os
+import pickle
+import shutil
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 
+# Accepted spellings of a true value in CSV fields; membership testing
+# avoids a per-field lower() allocation
+_TRUE = {"true", "True", "TRUE", "1"}
+
+
 class SaveLoadManager:
-    """Manages saving and loading game data using CSV files.
+    """Manages saving and loading game data.
     
     This class handles persistent storage of player data, world state,
-    and game statistics using CSV format for easy data management.
+    and game statistics. Player and world data use binary formats with
+    legacy JSON/CSV fallbacks on load; statistics stay CSV for easy
+    inspection (and the world keeps a CSV export for human readability).
     Includes error handling and directory management.
     """
     
+    # How many presence queries between full directory rescans
+    _PRESENCE_REFRESH = 32
+
     def __init__(self, save_directory: str = "game_saves"):
         """Initialize the save/load manager with specified directory.
         
@@ -21,14 +38,63 @@ class SaveLoadManager:
         
         # Dictionary mapping save types to filenames
         self.save_files: dict = {
-            "player": "player_data.csv",
+            "player_binary": "player_data.bin",
+            "player": "player_data.json",
+            "player_csv": "player_data.csv",
             "statistics": "game_statistics.csv", 
             "world": "world_data.csv",
-            "locations": "location_data.csv"
+            "locations": "location_data.csv",
+            "world_binary": "world_data.bin"
         }
         
         # Ensure save directory exists
         self._ensure_save_directory()
+        
+        # Precomputed full path per save type; _get_full_path only runs
+        # for dynamic names (backups) after this
+        self.full_paths: dict = {
+            save_type: self._get_full_path(filename)
+            for save_type, filename in self.save_files.items()
+        }
+        
+        # Persistent appender for the statistics file, opened lazily on
+        # the first save and reused for the rest of the session
+        self._stats_fh = None
+        self._stats_writer = None
+
+        # Cached set of file names present in the save directory. Saves
+        # and deletes update it in place; a full rescan every
+        # _PRESENCE_REFRESH queries bounds staleness if something else
+        # touches the directory
+        self._presence = None
+        self._presence_queries = 0
+
+        # Briefly cached save timestamp so a burst of saves (e.g. player
+        # + world + statistics on one autosave) formats it once
+        self._cached_ts = None
+        self._cached_ts_at = 0.0
+    
+    def _now_iso(self) -> str:
+        """Current ISO timestamp, cached for 50 ms.
+
+        Saves in the same burst share one clock read and one strftime
+        instead of paying both per file.
+        """
+        now = time.monotonic()
+        if self._cached_ts is None or now - self._cached_ts_at > 0.05:
+            self._cached_ts = datetime.now().isoformat()
+            self._cached_ts_at = now
+        return self._cached_ts
+
+    def close(self) -> None:
+        """Release the persistent statistics file handle."""
+        if self._stats_fh is not None:
+            self._stats_fh.close()
+            self._stats_fh = None
+            self._stats_writer = None
+    
+    def __del__(self):
+        self.close()
     
     def _ensure_save_directory(self) -> None:
         """Create the save directory if it doesn't exist.
@@ -52,7 +118,11 @@ class SaveLoadManager:
         return os.path.join(self.save_directory, filename)
     
     def save_player_data(self, player) -> bool:
-        """Save player data to CSV file with timestamp and version info.
+        """Save player data as a binary pickle with timestamp and version.
+        
+        Pickle keeps native types end to end — no per-field string
+        formatting on save and no int/float parsing on load — and the
+        file matches the binary world format.
         
         Args:
             player: Player object to save
@@ -60,40 +130,65 @@ class SaveLoadManager:
         Returns:
             bool: True if save successful, False otherwise
         """
-        filepath = self._get_full_path(self.save_files["player"])
+        filepath = self.full_paths["player_binary"]
         
         try:
             # Get player data as dictionary
             player_data = player.get_save_data()
             
             # Add metadata
-            player_data["save_timestamp"] = datetime.now().isoformat()
+            player_data["save_timestamp"] = self._now_iso()
             player_data["game_version"] = "1.0"
             
-            # Write to CSV (file writing requirement)
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                # Get all keys for fieldnames
-                fieldnames = list(player_data.keys())
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # Write header and data
-                writer.writeheader()
-                writer.writerow(player_data)
-            
+            with open(filepath, 'wb') as savefile:
+                pickle.dump(player_data, savefile, protocol=pickle.HIGHEST_PROTOCOL)
+
+            self._note_file(self.save_files["player_binary"], True)
             print(f"Player data saved to {filepath}")
             return True
             
-        except (IOError, OSError, csv.Error) as e:
+        except (IOError, OSError, pickle.PicklingError) as e:
             print(f"Error saving player data: {e}")
             return False
     
     def load_player_data(self, player) -> bool:
-        filepath = self._get_full_path(self.save_files["player"])
+        filepath = self.full_paths["player_binary"]
         
-        # Check if file exists
-        if not os.path.exists(filepath):
-            print("No save file found. Starting with default player data.")
+        try:
+            with open(filepath, 'rb') as savefile:
+                player.load_save_data(pickle.load(savefile))
+            
+            print(f"Player data loaded from {filepath}")
+            return True
+            
+        except FileNotFoundError:
+            # Older versions saved the player as JSON or CSV
+            return self._load_player_json(player)
+        except (IOError, OSError, pickle.UnpicklingError, EOFError, ValueError) as e:
+            # EOFError: pickle.load on an empty or truncated file
+            print(f"Error loading player data: {e}")
             return False
+    
+    def _load_player_json(self, player) -> bool:
+        """Legacy loader for the JSON player format."""
+        filepath = self.full_paths["player"]
+        
+        try:
+            with open(filepath, 'r', encoding='utf-8') as savefile:
+                player.load_save_data(json.load(savefile))
+            
+            print(f"Player data loaded from {filepath}")
+            return True
+            
+        except FileNotFoundError:
+            return self._load_player_csv(player)
+        except (IOError, OSError, ValueError) as e:
+            print(f"Error loading player data: {e}")
+            return False
+    
+    def _load_player_csv(self, player) -> bool:
+        """Legacy loader for the single-row CSV player format."""
+        filepath = self.full_paths["player_csv"]
         
         try:
             # Read from CSV file
@@ -110,31 +205,42 @@ class SaveLoadManager:
                 print("Save file is empty.")
                 return False
                 
+        except FileNotFoundError:
+            print("No save file found. Starting with default player data.")
+            return False
         except (IOError, OSError, csv.Error, ValueError) as e:
             print(f"Error loading player data: {e}")
             return False
     
     def save_game_statistics(self, stats: dict) -> bool:
-        filepath = self._get_full_path(self.save_files["statistics"])
+        filepath = self.full_paths["statistics"]
         
         try:
             # Add session information
             session_stats = stats.copy()
-            session_stats["session_timestamp"] = datetime.now().isoformat()
-            
-            # Determine if we're appending or creating new file
-            file_exists = os.path.exists(filepath)
-            mode = 'a' if file_exists else 'w'
+            session_stats["session_timestamp"] = self._now_iso()
             
-            with open(filepath, mode, newline='', encoding='utf-8') as csvfile:
-                fieldnames = list(session_stats.keys())
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # Write header only if new file
-                if not file_exists:
-                    writer.writeheader()
-                
-                writer.writerow(session_stats)
+            # Open once, append for the rest of the session: no
+            # per-save open/stat/close churn
+            if self._stats_fh is None:
+                write_header = (
+                    self.save_files["statistics"] not in self._existing_save_files()
+                    or os.path.getsize(filepath) == 0)
+                self._stats_fh = open(filepath, 'a', newline='',
+                                      encoding='utf-8', buffering=8192)
+                self._note_file(self.save_files["statistics"], True)
+                self._stats_writer = csv.DictWriter(
+                    self._stats_fh, fieldnames=list(session_stats.keys()))
+                if write_header:
+                    self._stats_writer.writeheader()
+            elif set(session_stats) != set(self._stats_writer.fieldnames):
+                # The stats keys changed mid-session: rebind the writer
+                # to the new key set instead of raising on unknown fields
+                self._stats_writer = csv.DictWriter(
+                    self._stats_fh, fieldnames=list(session_stats.keys()))
+
+            self._stats_writer.writerow(session_stats)
+            self._stats_fh.flush()
             
             print(f"Statistics saved to {filepath}")
             return True
@@ -144,73 +250,149 @@ class SaveLoadManager:
             return False
     
     def load_latest_statistics(self):
-        filepath = self._get_full_path(self.save_files["statistics"])
-        
-        if not os.path.exists(filepath):
-            return None
+        filepath = self.full_paths["statistics"]
         
         try:
             with open(filepath, 'r', newline='', encoding='utf-8') as csvfile:
                 reader = csv.DictReader(csvfile)
                 
-                # Read all rows and get the last one (most recent)
-                rows = list(reader)
-                if rows:
-                    return rows[-1]  # Return latest statistics
+                # Stream to the last row (most recent) without
+                # materializing the whole history in memory
+                latest = None
+                for row in reader:
+                    latest = row
                 
-                return None
+                return latest
                 
+        except FileNotFoundError:
+            return None
         except (IOError, OSError, csv.Error) as e:
             print(f"Error loading statistics: {e}")
             return None
     
     def save_world_data(self, world) -> bool:
+        """Save the world as one compressed binary payload.
+
+        A pickle of {"stats": ..., "locations": [...]} compressed with
+        zlib: one write, no per-field string formatting, and a fraction
+        of the CSV size. Use export_world_csv for a readable dump.
+        """
+        filepath = self.full_paths["world_binary"]
+        
+        try:
+            world_stats = world.get_world_statistics()
+            world_stats["save_timestamp"] = self._now_iso()
+
+            payload = {
+                "stats": world_stats,
+                "locations": [
+                    (coords[0], coords[1], location.name, location.properties,
+                     location.items, coords in world.discovered_locations)
+                    for coords, location in world.locations.items()
+                ]
+            }
+            
+            blob = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+            with open(filepath, 'wb') as savefile:
+                savefile.write(blob)
+
+            self._note_file(self.save_files["world_binary"], True)
+            print(f"World data saved to {filepath}")
+            return True
+            
+        except (IOError, OSError, pickle.PicklingError) as e:
+            print(f"Error saving world data: {e}")
+            return False
+    
+    def load_world_data(self, world) -> bool:
+        """Load the world from the binary save, falling back to CSV.
+
+        The CSV fallback keeps saves from older versions loadable.
+        """
+        filepath = self.full_paths["world_binary"]
+        
+        try:
+            with open(filepath, 'rb') as savefile:
+                payload = pickle.loads(zlib.decompress(savefile.read()))
+            
+            entries = payload["locations"]
+            
+            from game_world import Location  # Import here to avoid circular imports
+            
+            def rebuild(entry):
+                location = Location(entry[0], entry[1], entry[2])
+                location.properties = entry[3]
+                location.items = entry[4]
+                return location
+            
+            # Rebind via comprehensions so CPython sizes each container
+            # once for the known entry count instead of rehashing as the
+            # old cleared dict grows back
+            world.locations = {(e[0], e[1]): rebuild(e) for e in entries}
+            world.discovered_locations = {(e[0], e[1]) for e in entries if e[5]}
+            
+            print(f"World data loaded from {filepath}")
+            return True
+            
+        except FileNotFoundError:
+            # Older saves only have the CSV export
+            return self.import_world_csv(world)
+        except (IOError, OSError, pickle.UnpicklingError, zlib.error, KeyError, ValueError) as e:
+            print(f"Error loading world data: {e}")
+            return False
+    
+    def export_world_csv(self, world) -> bool:
         # Save world statistics
-        world_stats_path = self._get_full_path(self.save_files["world"])
-        locations_path = self._get_full_path(self.save_files["locations"])
+        world_stats_path = self.full_paths["world"]
+        locations_path = self.full_paths["locations"]
         
         try:
             # Save world statistics
             world_stats = world.get_world_statistics()
-            world_stats["save_timestamp"] = datetime.now().isoformat()
-            
+            world_stats["save_timestamp"] = self._now_iso()
+
             with open(world_stats_path, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = list(world_stats.keys())
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerow(world_stats)
             
-            # Save location data (demonstrates loop with file operations)
-            with open(locations_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    "x", "y", "name", "visited_count", "has_coins", "coin_amount",
-                    "has_monster", "monster_type", "is_safe", "description",
-                    "items", "discovered"
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                # Write each location (loop requirement)
-                for coords, location in world.locations.items():
-                    x, y = coords
-                    
-                    row_data = {
-                        "x": x,
-                        "y": y,
-                        "name": location.name,
-                        "visited_count": location.properties["visited_count"],
-                        "has_coins": location.properties["has_coins"],
-                        "coin_amount": location.properties["coin_amount"],
-                        "has_monster": location.properties["has_monster"],
-                        "monster_type": location.properties["monster_type"] or "",
-                        "is_safe": location.properties["is_safe"],
-                        "description": location.properties["description"],
-                        "items": "|".join(location.items),  # Join list into string
-                        "discovered": coords in world.discovered_locations
-                    }
-                    
-                    writer.writerow(row_data)
+            # Save location data: serialize the whole CSV into memory and
+            # hand the kernel a single contiguous write
+            buffer = io.StringIO()
+            fieldnames = [
+                "x", "y", "name", "visited_count", "has_coins", "coin_amount",
+                "has_monster", "monster_type", "is_safe", "description",
+                "items", "discovered"
+            ]
+            # Plain csv.writer with pre-ordered tuples: no per-row
+            # fieldname-to-dict probing like DictWriter does
+            writer = csv.writer(buffer)
+            writer.writerow(fieldnames)
+            discovered_locations = world.discovered_locations
+            
+            # One writerows call lets the csv C code loop over the rows
+            writer.writerows(
+                (coords[0],
+                 coords[1],
+                 location.name,
+                 location.properties["visited_count"],
+                 location.properties["has_coins"],
+                 location.properties["coin_amount"],
+                 location.properties["has_monster"],
+                 location.properties["monster_type"] or "",
+                 location.properties["is_safe"],
+                 location.properties["description"],
+                 "|".join(location.items) if location.items else "",
+                 coords in discovered_locations)
+                for coords, location in world.locations.items()
+            )
             
+            with open(locations_path, 'wb') as csvfile:
+                csvfile.write(buffer.getvalue().encode('utf-8'))
+
+            self._note_file(self.save_files["world"], True)
+            self._note_file(self.save_files["locations"], True)
             print(f"World data saved to {world_stats_path} and {locations_path}")
             return True
             
@@ -218,77 +400,131 @@ class SaveLoadManager:
             print(f"Error saving world data: {e}")
             return False
     
-    def load_world_data(self, world) -> bool:
-        locations_path = self._get_full_path(self.save_files["locations"])
-        
-        if not os.path.exists(locations_path):
-            print("No world save data found.")
-            return False
+    def import_world_csv(self, world) -> bool:
+        locations_path = self.full_paths["locations"]
         
         try:
-            # Clear existing world data
-            world.locations.clear()
-            world.discovered_locations.clear()
-            
-            # Load location data
+            # Load location data with the plain csv.reader: resolve the
+            # column order once from the header, then index each row as a
+            # list — no per-row dict construction like DictReader does
             with open(locations_path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
+                if header is None:
+                    print("No world save data found.")
+                    return False
+                column = {name: index for index, name in enumerate(header)}
+                i_x = column["x"]
+                i_y = column["y"]
+                i_name = column["name"]
+                i_visited = column["visited_count"]
+                i_has_coins = column["has_coins"]
+                i_coin_amount = column["coin_amount"]
+                i_has_monster = column["has_monster"]
+                i_monster_type = column["monster_type"]
+                i_is_safe = column["is_safe"]
+                i_description = column["description"]
+                i_items = column["items"]
+                i_discovered = column["discovered"]
                 
+                from game_world import Location  # Import here to avoid circular imports
+                
+                # Accumulate (coords, location) pairs and build the dict
+                # in one shot below, sizing it once for the row count
+                pairs = []
+                discovered = []
                 for row in reader:
                     # Parse coordinate data
-                    x = int(row["x"])
-                    y = int(row["y"])
+                    x = int(row[i_x])
+                    y = int(row[i_y])
                     coords = (x, y)
                     
                     # Create location
-                    from game_world import Location  # Import here to avoid circular imports
-                    location = Location(x, y, row["name"])
+                    location = Location(x, y, row[i_name])
                     
-                    # Set location properties (demonstrates type conversion)
-                    location.properties["visited_count"] = int(row["visited_count"])
-                    location.properties["has_coins"] = row["has_coins"].lower() == "true"
-                    location.properties["coin_amount"] = int(row["coin_amount"])
-                    location.properties["has_monster"] = row["has_monster"].lower() == "true"
-                    location.properties["monster_type"] = row["monster_type"] if row["monster_type"] else None
-                    location.properties["is_safe"] = row["is_safe"].lower() == "true"
-                    location.properties["description"] = row["description"]
+                    # Set location properties; booleans are set membership
+                    # tests instead of lower() + compare per field
+                    properties = location.properties
+                    properties["visited_count"] = int(row[i_visited])
+                    properties["has_coins"] = row[i_has_coins] in _TRUE
+                    properties["coin_amount"] = int(row[i_coin_amount])
+                    properties["has_monster"] = row[i_has_monster] in _TRUE
+                    properties["monster_type"] = row[i_monster_type] or None
+                    properties["is_safe"] = row[i_is_safe] in _TRUE
+                    properties["description"] = row[i_description]
                     
                     # Parse items list
-                    if row["items"]:
-                        location.items = row["items"].split("|")
-                    else:
-                        location.items = []
-                    
-                    # Add to world
-                    world.locations[coords] = location
+                    items = row[i_items]
+                    location.items = items.split("|") if items else []
                     
-                    # Add to discovered if marked as discovered
-                    if row["discovered"].lower() == "true":
-                        world.discovered_locations.add(coords)
+                    pairs.append((coords, location))
+                    if row[i_discovered] in _TRUE:
+                        discovered.append(coords)
+                
+                world.locations = dict(pairs)
+                world.discovered_locations = set(discovered)
             
             print(f"World data loaded from {locations_path}")
             return True
             
+        except FileNotFoundError:
+            print("No world save data found.")
+            return False
         except (IOError, OSError, csv.Error, ValueError, KeyError) as e:
             print(f"Error loading world data: {e}")
             return False
     
+    def _existing_save_files(self) -> set:
+        """Return the file names present in the save directory, cached.
+
+        One scandir fills the cache (DirEntry.is_file is answered from
+        the directory listing without extra stats); later calls reuse it,
+        with _note_file keeping it current as files are written and
+        removed.
+        """
+        self._presence_queries += 1
+        if (self._presence is None
+                or self._presence_queries >= self._PRESENCE_REFRESH):
+            self._presence_queries = 0
+            try:
+                with os.scandir(self.save_directory) as entries:
+                    self._presence = {entry.name for entry in entries
+                                      if entry.is_file(follow_symlinks=False)}
+            except OSError:
+                self._presence = set()
+        return self._presence
+
+    def _note_file(self, filename: str, present: bool) -> None:
+        """Record a write or removal in the presence cache, if filled."""
+        if self._presence is not None:
+            if present:
+                self._presence.add(filename)
+            else:
+                self._presence.discard(filename)
+    
     def get_all_save_files(self) -> list:
+        present = self._existing_save_files()
         existing_files = [
             filename for save_type, filename in self.save_files.items()
-            if os.path.exists(self._get_full_path(filename))
+            if filename in present
         ]
         
         return existing_files
     
     def delete_save_data(self, save_type: str = None) -> bool:
         try:
+            # Release the statistics handle before removing its file
+            if save_type is None or save_type == "statistics":
+                self.close()
+            
             if save_type is None:
-                # Delete all save files
+                # Delete all save files (one directory scan, no per-file stat)
+                present = self._existing_save_files()
                 for filename in self.save_files.values():
-                    filepath = self._get_full_path(filename)
-                    if os.path.exists(filepath):
+                    if filename in present:
+                        filepath = self._get_full_path(filename)
                         os.remove(filepath)
+                        self._note_file(filename, False)
                         print(f"Deleted {filepath}")
                 
                 # Try to remove save directory if empty
@@ -303,13 +539,14 @@ class SaveLoadManager:
                 return True
                 
             elif save_type in self.save_files:
-                # Delete specific save file
-                filepath = self._get_full_path(self.save_files[save_type])
-                if os.path.exists(filepath):
+                # Delete specific save file (EAFP: remove, catch missing)
+                filepath = self.full_paths[save_type]
+                try:
                     os.remove(filepath)
+                    self._note_file(self.save_files[save_type], False)
                     print(f"Deleted {filepath}")
                     return True
-                else:
+                except FileNotFoundError:
                     print(f"Save file {filepath} does not exist")
                     return False
             else:
@@ -324,21 +561,29 @@ class SaveLoadManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         try:
+            present = self._existing_save_files()
+            
+            # Collect the (source, backup) pairs first
+            pairs = []
             for save_type, filename in self.save_files.items():
-                source_path = self._get_full_path(filename)
-                
-                if os.path.exists(source_path):
-                    # Create backup filename
+                if filename in present:
                     name, ext = os.path.splitext(filename)
                     backup_filename = f"{name}_backup_{timestamp}{ext}"
-                    backup_path = self._get_full_path(backup_filename)
-                    
-                    # Copy file content
-                    with open(source_path, 'r', encoding='utf-8') as source:
-                        with open(backup_path, 'w', encoding='utf-8') as backup:
-                            backup.write(source.read())
-                    
-                    print(f"Backed up {filename} to {backup_filename}")
+                    pairs.append((self._get_full_path(filename),
+                                  self._get_full_path(backup_filename),
+                                  filename, backup_filename))
+            
+            if not pairs:
+                return True
+            
+            # The copies are independent files and copyfile releases the
+            # GIL in its C I/O, so a small pool overlaps the writes
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda p: shutil.copyfile(p[0], p[1]), pairs))
+            
+            for _, _, filename, backup_filename in pairs:
+                self._note_file(backup_filename, True)
+                print(f"Backed up {filename} to {backup_filename}")
             
             return True
             
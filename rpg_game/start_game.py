@@ -13,8 +13,10 @@ Run this file to start the game: python3 start_game.py
 import sys
 import os
 
-# Add the game directory to Python path
-sys.path.insert(0, '/Users/aparnavenkatesh/Desktop/Labyrinth/rpg_game')
+# Add the game directory to Python path. Derived from this file's own
+# location so it works on any machine, and it points at a real directory
+# instead of taxing every import with probes of a nonexistent path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def main():
     """Main entry point - initialize and start the game."""